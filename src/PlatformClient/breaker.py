@@ -0,0 +1,154 @@
+import asyncio
+import http.client
+import time
+from typing import Literal, Optional
+
+from .exceptions import CircuitOpenError
+
+FAILURE_STATUSES = frozenset({500, 502, 503, 504})
+
+FAILURE_EXCEPTIONS: tuple[type[BaseException], ...] = (
+    ConnectionError,
+    TimeoutError,
+    asyncio.TimeoutError,
+    asyncio.IncompleteReadError,
+    http.client.HTTPException,
+)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class _Circuit:
+    __slots__ = ("state", "failures", "opened_at", "trials", "successes")
+
+    def __init__(self):
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.trials = 0
+        self.successes = 0
+
+
+class CircuitBreaker:
+    """
+    Per-endpoint circuit breaker.
+
+    After ``failure_threshold`` consecutive failures (5xx responses or transport
+    errors) the circuit opens and calls fail immediately with
+    :class:`CircuitOpenError`. Once ``recovery_timeout`` seconds have passed it
+    turns half-open and lets up to ``half_open_max_calls`` trial calls through;
+    ``success_threshold`` successful trials close it again, a failed one
+    reopens it.
+
+    :param scope: ``"endpoint"`` keeps one circuit per endpoint path,
+        ``"controller"`` one per first path segment (``/CompanyBranchGroupSchedule``)
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+        half_open_max_calls: int = 1,
+        success_threshold: int = 1,
+        failure_statuses: frozenset[int] = FAILURE_STATUSES,
+        failure_exceptions: tuple[type[BaseException], ...] = FAILURE_EXCEPTIONS,
+        scope: Literal["endpoint", "controller"] = "endpoint",
+    ):
+        if failure_threshold < 1:
+            raise ValueError("failure_threshold must be at least 1")
+        if scope not in ("endpoint", "controller"):
+            raise ValueError(f"Unknown scope: {scope!r}. Use 'endpoint' or 'controller'")
+
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self.success_threshold = success_threshold
+        self.failure_statuses = failure_statuses
+        self.failure_exceptions = failure_exceptions
+        self.scope = scope
+
+        self._circuits: dict[str, _Circuit] = {}
+        self.opened = 0
+        self.rejected = 0
+
+    def key(self, endpoint: str) -> str:
+        if self.scope == "controller":
+            return "/" + endpoint.strip("/").split("/", 1)[0]
+        return endpoint
+
+    def _open(self, circuit: _Circuit):
+        circuit.state = OPEN
+        circuit.opened_at = time.monotonic()
+        circuit.trials = 0
+        circuit.successes = 0
+        self.opened += 1
+
+    def allow(self, endpoint: str):
+        """Let a call to ``endpoint`` through or raise :class:`CircuitOpenError`."""
+        circuit = self._circuits.get(self.key(endpoint))
+        if circuit is None or circuit.state == CLOSED:
+            return
+
+        if circuit.state == OPEN:
+            remaining = circuit.opened_at + self.recovery_timeout - time.monotonic()
+            if remaining > 0:
+                self.rejected += 1
+                raise CircuitOpenError(endpoint, remaining)
+            circuit.state = HALF_OPEN
+
+        if circuit.trials >= self.half_open_max_calls:
+            self.rejected += 1
+            raise CircuitOpenError(endpoint, 0.0)
+        circuit.trials += 1
+
+    def record(self, endpoint: str, success: Optional[bool]):
+        """
+        Report how an allowed call ended.
+
+        :param success: None when the call was abandoned and says nothing about the endpoint
+        """
+        key = self.key(endpoint)
+        circuit = self._circuits.get(key)
+        if circuit is None:
+            if success is not False:
+                return
+            circuit = self._circuits[key] = _Circuit()
+
+        if circuit.state == HALF_OPEN:
+            circuit.trials -= 1
+            if success is None:
+                return
+            if not success:
+                self._open(circuit)
+                return
+            circuit.successes += 1
+            if circuit.successes >= self.success_threshold:
+                circuit.state = CLOSED
+                circuit.failures = 0
+            return
+
+        if circuit.state == OPEN or success is None:
+            return
+        if success:
+            circuit.failures = 0
+            return
+        circuit.failures += 1
+        if circuit.failures >= self.failure_threshold:
+            self._open(circuit)
+
+    def state(self, endpoint: str) -> str:
+        circuit = self._circuits.get(self.key(endpoint))
+        return circuit.state if circuit is not None else CLOSED
+
+    def stats(self) -> dict:
+        return {
+            "opened": self.opened,
+            "rejected": self.rejected,
+            "circuits": {
+                key: {"state": circuit.state, "failures": circuit.failures}
+                for key, circuit in self._circuits.items()
+                if circuit.state != CLOSED or circuit.failures
+            },
+        }
@@ -0,0 +1,364 @@
+import contextlib
+import contextvars
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Iterator, Optional
+
+from .codec import JSONCodec
+from .invalidation import InvalidationMap, body_fields
+from .retry import is_idempotent
+from .utils import BufferedResponse, PlatformResponse, match_prefix
+
+if TYPE_CHECKING:
+    from .disk_cache import DiskCache
+
+# headers that described the body on the wire rather than the decoded body we keep
+_WIRE_HEADERS = frozenset({"content-encoding", "content-length", "transfer-encoding", "connection"})
+
+_bypass: contextvars.ContextVar[bool] = contextvars.ContextVar("PlatformClient_cache_bypass", default=False)
+
+
+@contextlib.contextmanager
+def bypass_cache() -> Iterator[None]:
+    """Skip the response cache for every call made inside this block."""
+    token = _bypass.set(True)
+    try:
+        yield
+    finally:
+        _bypass.reset(token)
+
+
+def cache_bypassed() -> bool:
+    return _bypass.get()
+
+
+class CacheEntry:
+    __slots__ = ("endpoint", "fields", "status", "reason", "headers", "body", "expires_at", "size")
+
+    def __init__(self, endpoint: str, fields: dict[str, str], status: int, reason: str,
+                 headers: list[tuple[str, str]], body: bytes, expires_at: float):
+        self.endpoint = endpoint
+        self.fields = fields
+        self.status = status
+        self.reason = reason
+        self.headers = headers
+        self.body = body
+        # wall clock, so entries keep their meaning across processes
+        self.expires_at = expires_at
+        self.size = len(body) + len(endpoint) + 256
+
+    @classmethod
+    def from_response(cls, endpoint: str, params: dict | str | None,
+                      response: PlatformResponse, ttl: float) -> "CacheEntry":
+        headers = [(name, value) for name, value in response.headers.items()
+                   if name.lower() not in _WIRE_HEADERS]
+        return cls(endpoint, body_fields(params), response.status, response.reason,
+                   headers, response.bytes(), time.time() + ttl)
+
+    @property
+    def validators(self) -> dict[str, str]:
+        """Conditional request headers that let the platform answer 304 for this entry."""
+        conditional = {}
+        for name, value in self.headers:
+            lowered = name.lower()
+            if lowered == "etag":
+                conditional["If-None-Match"] = value
+            elif lowered == "last-modified":
+                conditional["If-Modified-Since"] = value
+        return conditional
+
+    @property
+    def stale(self) -> bool:
+        return self.expires_at <= time.time()
+
+    def response(self, codec: JSONCodec, stream: bool = False) -> PlatformResponse:
+        buffered = BufferedResponse(self.status, self.reason, self.headers, self.body)
+        return PlatformResponse(buffered, stream=stream, codec=codec)
+
+
+class ResponseCache:
+    """
+    In-memory LRU cache of successful ``Get*`` responses.
+
+    Only endpoints under a prefix listed in ``ttls`` are cached, for that
+    prefix's TTL (``None`` or 0 there disables caching), e.g. detail and
+    access lookups. List pages stay uncached unless they are listed too, so a
+    paginated walk never mixes cached and live pages. A default ``ttl``
+    extends caching to every other ``Get*`` endpoint.
+    The least recently used entries are evicted once either ``max_entries`` or
+    ``max_bytes`` is exceeded. Every hit returns a fresh response object.
+
+    With ``stale_while_revalidate`` set, an entry up to that many seconds past
+    its TTL is still served, flagged as stale, and the client refreshes it in
+    the background.
+
+    After a mutating call the entries it makes stale are dropped according to
+    ``invalidations`` (see :class:`~PlatformClient.invalidation.InvalidationMap`).
+
+    With ``negative_ttl`` set, 404 and 403 answers of ``GetDetails`` calls are
+    remembered too, in a separate memory-only store with its own TTL. They are
+    dropped as soon as a write to the same controller and branch succeeds,
+    e.g. a ``Create`` that brings the missing object into existence.
+
+    Expired entries that carry an ``ETag`` or ``Last-Modified`` header are kept
+    until evicted, so the next call can revalidate them with ``If-None-Match``
+    / ``If-Modified-Since``; a 304 answer renews the entry without a body.
+
+    :param ttl: TTL in seconds for ``Get*`` endpoints not listed in ``ttls``;
+        None (the default) caches only the listed ones
+    :param ttls: Per-prefix TTLs, e.g. ``{"/CompanyBranchCourse/GetDetails": 600}``
+    :param stale_while_revalidate: Grace window after expiry in which stale entries are served
+    :param disk: Persistent tier consulted on memory misses and written through on every store
+    :param negative_ttl: TTL for cached not-found/forbidden answers; 0 disables negative caching
+    """
+
+    def __init__(
+        self,
+        ttl: Optional[float] = None,
+        ttls: Optional[dict[str, Optional[float]]] = None,
+        max_entries: int = 1024,
+        max_bytes: int = 16 * 1024 * 1024,
+        invalidations: Optional[InvalidationMap] = None,
+        stale_while_revalidate: float = 0.0,
+        disk: Optional["DiskCache"] = None,
+        negative_ttl: float = 0.0,
+        negative_statuses: frozenset[int] = frozenset({403, 404}),
+        max_negative_entries: int = 1024,
+    ):
+        if max_entries < 1 or max_bytes < 1:
+            raise ValueError("max_entries and max_bytes must be positive")
+
+        self.ttl = ttl
+        self.ttls = dict(ttls or {})
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.invalidations = invalidations or InvalidationMap()
+        self.stale_while_revalidate = stale_while_revalidate
+        self.disk = disk
+        self.negative_ttl = negative_ttl
+        self.negative_statuses = negative_statuses
+        self.max_negative_entries = max_negative_entries
+
+        self._entries: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._by_endpoint: dict[str, set[str]] = {}
+        self._negative: OrderedDict[str, CacheEntry] = OrderedDict()
+        self.size = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidated = 0
+        self.stale_hits = 0
+        self.revalidations = 0
+        self.negative_hits = 0
+        self.not_modified = 0
+        # bumped by every invalidation so reads that raced a write are not stored
+        self.generation = 0
+
+    def ttl_for(self, endpoint: str) -> Optional[float]:
+        if not is_idempotent(endpoint):
+            return None
+        prefix = match_prefix(endpoint, self.ttls)
+        ttl = self.ttls[prefix] if prefix is not None else self.ttl
+        return ttl or None
+
+    def caches_negative(self, endpoint: str) -> bool:
+        return self.negative_ttl > 0 and endpoint.rstrip("/").endswith("/GetDetails")
+
+    def cacheable(self, endpoint: str) -> bool:
+        return self.ttl_for(endpoint) is not None or self.caches_negative(endpoint)
+
+    async def get(self, key: str) -> Optional[CacheEntry]:
+        """Entry for ``key`` if it is fresh or still within the stale grace window."""
+        negative = self._negative.get(key)
+        if negative is not None:
+            if negative.expires_at > time.time():
+                self._negative.move_to_end(key)
+                self.negative_hits += 1
+                return negative
+            del self._negative[key]
+
+        entry = self._entries.get(key)
+        from_disk = False
+        if entry is None and self.disk is not None:
+            generation = self.generation
+            entry = await self.disk.aget(key)
+            # an invalidation that ran while the disk was read may have removed this row
+            from_disk = entry is not None and generation == self.generation
+            if not from_disk:
+                entry = None
+        if entry is None:
+            self.misses += 1
+            return None
+
+        now = time.time()
+        if entry.expires_at + self.stale_while_revalidate <= now:
+            if entry.validators:
+                # kept for a conditional request
+                if from_disk:
+                    self._store(key, entry)
+            else:
+                self._remove(key)
+                if self.disk is not None:
+                    self.disk.delete([key])
+            self.expirations += 1
+            self.misses += 1
+            return None
+
+        if entry.expires_at <= now:
+            self.stale_hits += 1
+        else:
+            self.hits += 1
+        if from_disk:
+            self._store(key, entry)
+        else:
+            self._entries.move_to_end(key)
+        return entry
+
+    def put(self, key: str, endpoint: str, params: dict | str | None, response: PlatformResponse,
+            generation: Optional[int] = None):
+        """
+        Store ``response`` under ``key``.
+
+        :param generation: :attr:`generation` seen before the call was sent; the
+            response is dropped if an invalidation happened in the meantime
+        """
+        if generation is not None and generation != self.generation:
+            return
+
+        if response.status in self.negative_statuses and self.caches_negative(endpoint):
+            self._remove(key)
+            self._negative[key] = CacheEntry.from_response(endpoint, params, response, self.negative_ttl)
+            if len(self._negative) > self.max_negative_entries:
+                self._negative.popitem(last=False)
+            return
+
+        ttl = self.ttl_for(endpoint)
+        if ttl is None or not response.ok:
+            return
+        self._negative.pop(key, None)
+
+        entry = CacheEntry.from_response(endpoint, params, response, ttl)
+        if self.disk is not None:
+            self.disk.put(key, entry)
+        if entry.size <= self.max_bytes:
+            self._store(key, entry)
+
+    def conditional_headers(self, key: str) -> Optional[dict[str, str]]:
+        """Validators of the (usually expired) entry under ``key``, if it has any."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        return entry.validators or None
+
+    def refresh(self, key: str, not_modified: PlatformResponse) -> Optional[CacheEntry]:
+        """Renew the entry under ``key`` after the platform answered 304 Not Modified."""
+        entry = self._entries.get(key)
+        ttl = self.ttl_for(entry.endpoint) if entry is not None else None
+        if ttl is None:
+            return None
+
+        fresh = {name.lower(): value for name, value in not_modified.headers.items()}
+        entry.headers = [
+            (name, fresh.pop(name.lower(), value)) if name.lower() in ("etag", "last-modified", "cache-control")
+            else (name, value)
+            for name, value in entry.headers
+        ]
+        entry.expires_at = time.time() + ttl
+        self._entries.move_to_end(key)
+        if self.disk is not None:
+            self.disk.put(key, entry)
+        self.not_modified += 1
+        return entry
+
+    def _store(self, key: str, entry: CacheEntry):
+        self._remove(key)
+        self._entries[key] = entry
+        self._by_endpoint.setdefault(entry.endpoint, set()).add(key)
+        self.size += entry.size
+        while len(self._entries) > self.max_entries or self.size > self.max_bytes:
+            self._remove(next(iter(self._entries)))
+            self.evictions += 1
+
+    def _remove(self, key: str) -> Optional[CacheEntry]:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.size -= entry.size
+            keys = self._by_endpoint[entry.endpoint]
+            keys.discard(key)
+            if not keys:
+                del self._by_endpoint[entry.endpoint]
+        return entry
+
+    def invalidate(self, endpoint: str, params: dict | str | None = None) -> int:
+        """
+        Drop the entries that a call of the mutating ``endpoint`` with ``params`` makes stale.
+
+        :return: Number of dropped entries
+        """
+        self.generation += 1
+        fields = body_fields(params)
+        stale = set()
+
+        rule = self.invalidations.rule_for(endpoint)
+        if rule is not None:
+            constraints = {key: fields[key] for key in rule.keys if key in fields}
+
+            def matches(entry_fields: dict[str, str]) -> bool:
+                return all(entry_fields.get(name, value) == value for name, value in constraints.items())
+
+            for cached_endpoint, keys in self._by_endpoint.items():
+                if match_prefix(cached_endpoint, rule.reads) is not None:
+                    stale.update(key for key in keys if matches(self._entries[key].fields))
+
+            for key in stale:
+                self._remove(key)
+
+            if self.disk is not None:
+                # counted in the disk tier's own stats once the worker has run it
+                self.disk.invalidate(rule.reads, matches)
+
+        # cached 404/403 answers of the controller go away even when no read rule applies
+        controller = "/" + endpoint.strip("/").split("/", 1)[0]
+        branch = fields.get("companybranchid")
+        for key, entry in list(self._negative.items()):
+            if (match_prefix(entry.endpoint, [controller]) is not None
+                    and (branch is None or entry.fields.get("companybranchid", branch) == branch)):
+                del self._negative[key]
+                stale.add(key)
+
+        self.invalidated += len(stale)
+        return len(stale)
+
+    def clear(self):
+        if self.disk is not None:
+            self.disk.clear()
+        self._entries.clear()
+        self._negative.clear()
+        self._by_endpoint.clear()
+        self.size = 0
+
+    def close(self):
+        if self.disk is not None:
+            self.disk.close()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> dict:
+        return {
+            "entries": len(self._entries),
+            "bytes": self.size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "invalidated": self.invalidated,
+            "stale_hits": self.stale_hits,
+            "negative_entries": len(self._negative),
+            "negative_hits": self.negative_hits,
+            "not_modified": self.not_modified,
+            "revalidations": self.revalidations,
+            "disk": self.disk.stats() if self.disk is not None else None,
+        }
@@ -1,17 +1,64 @@
 import asyncio
+import functools
+import ssl
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
 from http.client import HTTPResponse
+from typing import Literal, Optional
 from urllib.parse import urlparse
 
+from .breaker import CircuitBreaker
+from .cache import ResponseCache, cache_bypassed
+from .codec import JSONCodec, get_codec
+from .hedge import HedgePolicy
 from .models.branch import BranchMethods, BranchClass
 from .models.company import CompanyMethods
+from .concurrency import AdaptiveLimiter
+from .pagesize import PageSizer
+from .pool import ConnectionPool
+from .ratelimit import RateLimiter
+from .retry import RetryPolicy, is_idempotent
+from .transport import AsyncConnectionPool, async_request
 from .types import SafeUUID
-from .utils import PlatformResponse
+from .utils import PlatformResponse, canonical_key, sync_request
+
+
+def _close_abandoned(future: asyncio.Future):
+    if not future.cancelled() and future.exception() is None:
+        future.result().close()
 
 
 class PlatformClient:
-    def __init__(self, url: str, api_id: SafeUUID | str, api_access_token: str):
+    def __init__(
+        self,
+        url: str,
+        api_id: SafeUUID | str,
+        api_access_token: str,
+        *,
+        pool_size: int = 10,
+        pool_idle_timeout: float = 60.0,
+        transport: Literal["thread", "asyncio"] = "thread",
+        max_workers: int = 16,
+        max_in_flight: Optional[int] = None,
+        ssl_context: Optional[ssl.SSLContext] = None,
+        max_body_size: Optional[int] = None,
+        json_codec: str | JSONCodec | None = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        adaptive_concurrency: Optional[AdaptiveLimiter] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        hedging: Optional[HedgePolicy] = None,
+        coalesce_reads: bool = False,
+        cache: Optional[ResponseCache] = None,
+        page_sizer: Optional[PageSizer] = None,
+    ):
         if not url.startswith("https://"):
             raise ValueError("URL must start with https://")
+        if transport not in ("thread", "asyncio"):
+            raise ValueError(f"Unknown transport: {transport!r}. Use 'thread' or 'asyncio'")
+        if max_in_flight is not None and max_in_flight < 1:
+            raise ValueError("max_in_flight must be at least 1")
 
         parsed = urlparse(url)
 
@@ -22,14 +69,358 @@ class PlatformClient:
         self.api_access_token: str = api_access_token
 
         self.debug_logs = False
+        self.max_body_size = max_body_size
+        self.json_codec: JSONCodec = get_codec(json_codec)
+        self.retry_policy: RetryPolicy = retry_policy or RetryPolicy()
+        self.rate_limiter: Optional[RateLimiter] = rate_limiter
+        self.circuit_breaker: Optional[CircuitBreaker] = circuit_breaker
+        self.hedging: Optional[HedgePolicy] = hedging
+        self.coalesce_reads = coalesce_reads
+        self._reads_in_flight: dict[str, asyncio.Task] = {}
+        self._coalesced = 0
+        self.cache: Optional[ResponseCache] = cache
+        self._revalidating: dict[str, asyncio.Task] = {}
+        self.page_sizer: Optional[PageSizer] = page_sizer
+
+        self.transport = transport
+        self.ssl_context: ssl.SSLContext = ssl_context or ssl.create_default_context()
+        self.pool = ConnectionPool(
+            max_size=pool_size,
+            idle_timeout=pool_idle_timeout,
+            ssl_context=self.ssl_context,
+        )
+        self.async_pool = AsyncConnectionPool(
+            max_size=pool_size,
+            idle_timeout=pool_idle_timeout,
+            ssl_context=self.ssl_context,
+        )
+
+        self.max_workers = max_workers
+        self.max_in_flight = max_in_flight
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="PlatformClient")
+        # one semaphore per event loop, since a semaphore binds to the first loop that waits on it
+        self._in_flight_limits: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore] = \
+            weakref.WeakKeyDictionary()
+        self.adaptive_concurrency: Optional[AdaptiveLimiter] = adaptive_concurrency
+        self._in_flight = 0
+        self._waiting = 0
+        self._requests = 0
+        self._bytes_received = 0
+        self._bytes_decoded = 0
+        self._bytes_lock = threading.Lock()
 
         self.Company = CompanyMethods(self)
         self.Branch = BranchMethods(self)
 
+    def close(self):
+        """Close all idle pooled connections, shut the request executor down and close the cache."""
+        self.pool.close()
+        self.async_pool.close()
+        self.executor.shutdown(wait=False)
+        if self.cache is not None:
+            self.cache.close()
+
+    def record_response(self, response: PlatformResponse):
+        """Account a response whose body has been fully read or dropped."""
+        with self._bytes_lock:
+            self._bytes_received += response.wire_bytes
+            self._bytes_decoded += response.body_bytes
+
+    def stats(self) -> dict:
+        return {
+            "requests": self._requests,
+            "in_flight": self._in_flight,
+            "waiting": self._waiting,
+            "max_in_flight": self.max_in_flight,
+            "max_workers": self.max_workers,
+            "bytes_received": self._bytes_received,
+            "bytes_decoded": self._bytes_decoded,
+            "pool": self.pool.stats(),
+            "async_pool": self.async_pool.stats(),
+            "retry": self.retry_policy.stats(),
+            "rate_limit": self.rate_limiter.stats() if self.rate_limiter is not None else None,
+            "concurrency": self.adaptive_concurrency.stats() if self.adaptive_concurrency is not None else None,
+            "circuit_breaker": self.circuit_breaker.stats() if self.circuit_breaker is not None else None,
+            "hedging": self.hedging.stats() if self.hedging is not None else None,
+            "coalesced": self._coalesced,
+            "cache": self.cache.stats() if self.cache is not None else None,
+            "page_sizes": self.page_sizer.stats() if self.page_sizer is not None else None,
+        }
+
     def GetBranch(self, branch_id: SafeUUID | str):
         return BranchClass(self, branch_id)
 
-    async def send_request(self, endpoint: str, params: dict | str | None = None) -> PlatformResponse:
-        from .utils import sync_request
+    async def send_request(
+        self,
+        endpoint: str,
+        params: dict | str | None = None,
+        *,
+        stream: bool = False,
+        use_cache: bool = True,
+    ) -> PlatformResponse:
+        """
+        Send a request to the platform.
+
+        :param endpoint: Endpoint path relative to the base URL, e.g. ``/CompanyBranchLead/Get``
+        :param params: JSON body (dict or already serialized string)
+        :param stream: Return as soon as the headers arrive and read the body lazily.
+            Streamed responses must be consumed or closed to free their connection.
+
+        :param use_cache: Set to False to skip the response cache for this call
+
+        With ``coalesce_reads`` enabled, identical ``Get*`` calls that overlap share one
+        network call and receive the same response object.
+        """
+        cache = self.cache if use_cache and not cache_bypassed() else None
+        key = None
+        if cache is not None and cache.cacheable(endpoint):
+            # api_id is part of the key: a persistent cache may be shared by several tokens
+            key = f"{self.api_id} {canonical_key(endpoint, params)}"
+            entry = await cache.get(key)
+            if entry is not None:
+                if entry.stale and entry.status < 400:
+                    self._revalidate(key, endpoint, params)
+                return entry.response(self.json_codec, stream)
+
+        if self.cache is not None and not is_idempotent(endpoint):
+            return await self._invalidating(endpoint, params, stream)
+
+        if key is None:
+            return await self._single_flight(endpoint, params, stream)
+
+        generation = cache.generation
+        conditional = cache.conditional_headers(key)
+        response = await self._single_flight(endpoint, params, stream, key, conditional)
+        if response.status == 304 and conditional:
+            # a 304 carries no body; draining it hands a streamed connection back to the pool
+            await response.aread()
+            response.close()
+            entry = cache.refresh(key, response)
+            if entry is not None:
+                return entry.response(self.json_codec, stream)
+            # the entry was evicted while we were asking, fetch the body after all
+            response = await self._single_flight(endpoint, params, stream, key)
+        if not stream:
+            cache.put(key, endpoint, params, response, generation)
+        return response
+
+    def _revalidate(self, key: str, endpoint: str, params: dict | str | None):
+        if key in self._revalidating:
+            return
+        self.cache.revalidations += 1
+        task = asyncio.ensure_future(self._refresh(key, endpoint, params))
+        self._revalidating[key] = task
+        task.add_done_callback(lambda _: self._revalidating.pop(key, None))
+
+    async def _refresh(self, key: str, endpoint: str, params: dict | str | None):
+        generation = self.cache.generation
+        conditional = self.cache.conditional_headers(key)
+        try:
+            response = await self._single_flight(endpoint, params, False, key, conditional)
+        except Exception as e:
+            # the stale entry keeps being served until its grace window runs out
+            if self.debug_logs:
+                print(f"[↻] {self.host}{self.base_path}{endpoint} : background refresh failed: {e!r}")
+            return
+        if response.status == 304 and conditional:
+            self.cache.refresh(key, response)
+        else:
+            self.cache.put(key, endpoint, params, response, generation)
+
+    async def _invalidating(self, endpoint: str, params: dict | str | None, stream: bool) -> PlatformResponse:
+        # a write that failed without a clear client error may still have been applied
+        response = None
+        try:
+            response = await self._send(endpoint, params, stream)
+            return response
+        finally:
+            if response is None or not 400 <= response.status < 500:
+                dropped = self.cache.invalidate(endpoint, params)
+                if dropped and self.debug_logs:
+                    print(f"[✗] {self.host}{self.base_path}{endpoint} : invalidated {dropped} cached responses")
+
+    async def _single_flight(self, endpoint: str, params: dict | str | None, stream: bool,
+                            key: Optional[str] = None,
+                            headers: Optional[dict[str, str]] = None) -> PlatformResponse:
+        if not self.coalesce_reads or stream or not is_idempotent(endpoint):
+            return await self._send(endpoint, params, stream, headers)
+
+        key = key or canonical_key(endpoint, params)
+        if headers:
+            # a conditional call may answer 304, which only means something to its own caller
+            key = f"{key} {sorted(headers.items())}"
+        task = self._reads_in_flight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._send(endpoint, params, stream, headers))
+            self._reads_in_flight[key] = task
+            task.add_done_callback(functools.partial(self._read_done, key))
+        else:
+            self._coalesced += 1
+        # a cancelled caller must not cancel the call for everyone else waiting on it
+        return await asyncio.shield(task)
+
+    def _read_done(self, key: str, task: asyncio.Task):
+        if self._reads_in_flight.get(key) is task:
+            del self._reads_in_flight[key]
+        if not task.cancelled():
+            task.exception()
+
+    async def _send(self, endpoint: str, params: dict | str | None, stream: bool,
+                    headers: Optional[dict[str, str]] = None) -> PlatformResponse:
         path = f"{self.base_path}{endpoint}"
-        return await asyncio.to_thread(sync_request, self, path, params)
\ No newline at end of file
+        policy = self.retry_policy
+
+        attempt = 1
+        while True:
+            try:
+                response = await self._hedged(endpoint, path, params, stream, headers)
+            except Exception as e:
+                delay = policy.exception_delay(endpoint, e, attempt)
+                if delay is None:
+                    raise
+            else:
+                delay = policy.response_delay(endpoint, response, attempt)
+                if delay is None:
+                    return response
+                response.close()
+
+            if self.debug_logs:
+                print(f"[↻] {self.host}{path} : attempt {attempt} failed, retrying in {delay:.2f}s")
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def _hedged(self, endpoint: str, path: str, params: dict | str | None, stream: bool,
+                      headers: Optional[dict[str, str]] = None) -> PlatformResponse:
+        hedging = self.hedging
+        if hedging is None or not is_idempotent(endpoint):
+            return await self._attempt(endpoint, path, params, stream, headers)
+
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        delay = hedging.delay(endpoint)
+        if delay is None:
+            response = await self._attempt(endpoint, path, params, stream, headers)
+            hedging.observe(endpoint, loop.time() - started)
+            return response
+
+        primary = asyncio.ensure_future(self._attempt(endpoint, path, params, stream, headers))
+        try:
+            done, _ = await asyncio.wait({primary}, timeout=delay)
+        except asyncio.CancelledError:
+            primary.cancel()
+            raise
+        if done or not hedging.take_budget():
+            response = await primary
+            hedging.observe(endpoint, loop.time() - started)
+            return response
+
+        if self.debug_logs:
+            print(f"[⇉] {self.host}{path} : no answer after {delay:.3f}s, hedging")
+
+        hedge = asyncio.ensure_future(self._attempt(endpoint, path, params, stream, headers))
+        pending = {primary, hedge}
+        try:
+            while True:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                winner = next((task for task in done if task.exception() is None), None)
+                if winner is not None:
+                    break
+                if not pending:
+                    # both attempts failed, surface the original one's error
+                    return primary.result()
+        finally:
+            for task in pending:
+                task.cancel()
+
+        for task in done - {winner}:
+            # both finished in the same tick, drop the spare response (a failed one has nothing to close)
+            if task.exception() is None:
+                task.result().close()
+        if winner is hedge:
+            hedging.hedge_wins += 1
+        hedging.observe(endpoint, loop.time() - started)
+        return winner.result()
+
+    async def _attempt(self, endpoint: str, path: str, params: dict | str | None, stream: bool,
+                       headers: Optional[dict[str, str]] = None) -> PlatformResponse:
+        breaker = self.circuit_breaker
+        if breaker is None:
+            return await self._limited(endpoint, path, params, stream, headers)
+
+        breaker.allow(endpoint)
+        success = None
+        try:
+            response = await self._limited(endpoint, path, params, stream, headers)
+            success = response.status not in breaker.failure_statuses
+            return response
+        except breaker.failure_exceptions:
+            success = False
+            raise
+        finally:
+            breaker.record(endpoint, success)
+
+    async def _limited(self, endpoint: str, path: str, params: dict | str | None, stream: bool,
+                       headers: Optional[dict[str, str]] = None) -> PlatformResponse:
+        if self.rate_limiter is not None:
+            await self.rate_limiter.acquire(endpoint)
+
+        if not self.max_in_flight:
+            return await self._adaptive_dispatch(path, params, stream, headers)
+
+        loop = asyncio.get_running_loop()
+        in_flight_limit = self._in_flight_limits.get(loop)
+        if in_flight_limit is None:
+            in_flight_limit = self._in_flight_limits[loop] = asyncio.Semaphore(self.max_in_flight)
+
+        self._waiting += 1
+        try:
+            await in_flight_limit.acquire()
+        finally:
+            self._waiting -= 1
+        try:
+            return await self._adaptive_dispatch(path, params, stream, headers)
+        finally:
+            in_flight_limit.release()
+
+    async def _adaptive_dispatch(self, path: str, params: dict | str | None, stream: bool,
+                                 headers: Optional[dict[str, str]] = None) -> PlatformResponse:
+        limiter = self.adaptive_concurrency
+        if limiter is None:
+            return await self._dispatch(path, params, stream, headers)
+
+        started = await limiter.acquire()
+        overloaded, sample = False, True
+        try:
+            response = await self._dispatch(path, params, stream, headers)
+            overloaded = response.status in limiter.overload_statuses
+            return response
+        except (TimeoutError, asyncio.TimeoutError):
+            overloaded = True
+            raise
+        except BaseException:
+            sample = False
+            raise
+        finally:
+            limiter.release(started, overloaded=overloaded, sample=sample)
+
+    async def _dispatch(self, path: str, params: dict | str | None, stream: bool,
+                        headers: Optional[dict[str, str]] = None) -> PlatformResponse:
+        self._requests += 1
+        self._in_flight += 1
+        try:
+            if self.transport == "asyncio":
+                return await async_request(self, path, params, stream=stream, headers=headers)
+
+            loop = asyncio.get_running_loop()
+            future = loop.run_in_executor(
+                self.executor,
+                functools.partial(sync_request, self, path, params, stream=stream, headers=headers),
+            )
+            try:
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                # the worker thread cannot be interrupted; free its connection once it is done
+                future.add_done_callback(_close_abandoned)
+                raise
+        finally:
+            self._in_flight -= 1
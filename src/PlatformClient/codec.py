@@ -0,0 +1,112 @@
+import json
+from typing import Any, Optional
+from uuid import UUID
+
+
+def _default(obj: Any):
+    if isinstance(obj, UUID):
+        return str(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+class JSONCodec:
+    """
+    Standard library codec and the interface every codec implements.
+
+    ``dumps`` returns compact UTF-8 bytes ready to be sent, ``loads`` accepts
+    ``bytes`` directly and raises ``ValueError`` on malformed input.
+    """
+    name = "json"
+
+    def dumps(self, obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False, default=_default).encode("utf-8")
+
+    def loads(self, data: bytes | str) -> Any:
+        return json.loads(data)
+
+
+class OrjsonCodec(JSONCodec):
+    name = "orjson"
+
+    def __init__(self):
+        import orjson
+        self._orjson = orjson
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._orjson.dumps(obj, default=_default)
+
+    def loads(self, data: bytes | str) -> Any:
+        return self._orjson.loads(data)
+
+
+class MsgspecCodec(JSONCodec):
+    name = "msgspec"
+
+    def __init__(self):
+        import msgspec
+        self._encoder = msgspec.json.Encoder(enc_hook=_default)
+        self._decoder = msgspec.json.Decoder()
+        self._error = msgspec.DecodeError
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._encoder.encode(obj)
+
+    def loads(self, data: bytes | str) -> Any:
+        try:
+            return self._decoder.decode(data)
+        except self._error as e:
+            raise ValueError(str(e)) from e
+
+
+class UjsonCodec(JSONCodec):
+    name = "ujson"
+
+    def __init__(self):
+        import ujson
+        self._ujson = ujson
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._ujson.dumps(obj, ensure_ascii=False, escape_forward_slashes=False,
+                                 default=_default).encode("utf-8")
+
+    def loads(self, data: bytes | str) -> Any:
+        return self._ujson.loads(data)
+
+
+CODECS: dict[str, type[JSONCodec]] = {
+    "orjson": OrjsonCodec,
+    "msgspec": MsgspecCodec,
+    "ujson": UjsonCodec,
+    "json": JSONCodec,
+}
+
+_default_codec: Optional[JSONCodec] = None
+
+
+def get_codec(codec: str | JSONCodec | None = None) -> JSONCodec:
+    """
+    Resolve a codec by name, or pick the fastest installed one when ``codec`` is None.
+
+    Auto-detection prefers orjson, then msgspec, then ujson and falls back to
+    the standard library.
+    """
+    global _default_codec
+
+    if isinstance(codec, JSONCodec):
+        return codec
+
+    if codec is not None:
+        try:
+            return CODECS[codec]()
+        except KeyError:
+            raise ValueError(f"Unknown JSON codec: {codec!r}. Use one of: {', '.join(CODECS)}")
+
+    if _default_codec is None:
+        for codec_class in CODECS.values():
+            try:
+                _default_codec = codec_class()
+                break
+            except ImportError:
+                continue
+
+    return _default_codec
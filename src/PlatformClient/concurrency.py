@@ -0,0 +1,138 @@
+import asyncio
+import time
+from collections import deque
+from typing import Optional
+
+OVERLOAD_STATUSES = frozenset({429, 503})
+
+
+class AdaptiveLimiter:
+    """
+    In-flight limit that adapts itself with additive increase / multiplicative decrease.
+
+    Every response that comes back while the limit is fully used raises it by
+    ``1 / limit``, i.e. by about one slot per round trip. A 429/503, a timeout
+    or a latency above ``latency_tolerance`` times the smoothed baseline
+    multiplies it by ``backoff_ratio`` instead. Only requests sent after the
+    last decrease can trigger another one, so a burst of throttled responses
+    halves the limit once rather than collapsing it to ``min_limit``.
+
+    :param initial_limit: Starting number of concurrent requests
+    :param latency_tolerance: Latency spike threshold as a multiple of the baseline
+    :param smoothing: Weight of a new sample in the baseline latency average
+    :param history_size: How many limit changes are kept for :meth:`stats`
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = 8,
+        min_limit: int = 1,
+        max_limit: int = 256,
+        backoff_ratio: float = 0.5,
+        latency_tolerance: float = 2.0,
+        smoothing: float = 0.05,
+        overload_statuses: frozenset[int] = OVERLOAD_STATUSES,
+        history_size: int = 256,
+    ):
+        if not 1 <= min_limit <= initial_limit <= max_limit:
+            raise ValueError("Limits must satisfy 1 <= min_limit <= initial_limit <= max_limit")
+        if not 0 < backoff_ratio < 1:
+            raise ValueError("backoff_ratio must be between 0 and 1")
+
+        self.limit = float(initial_limit)
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.backoff_ratio = backoff_ratio
+        self.latency_tolerance = latency_tolerance
+        self.smoothing = smoothing
+        self.overload_statuses = overload_statuses
+
+        self.in_flight = 0
+        self.baseline: Optional[float] = None
+        self.increases = 0
+        self.decreases = 0
+        self.history: deque[tuple[float, int, str]] = deque(maxlen=history_size)
+
+        self._waiters: deque[asyncio.Future] = deque()
+        self._last_decrease = 0.0
+
+    def _has_room(self) -> bool:
+        return self.in_flight < int(self.limit)
+
+    def _wake(self):
+        while self._waiters and self._has_room():
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self.in_flight += 1
+                waiter.set_result(None)
+
+    async def acquire(self) -> float:
+        """Wait for a slot and return the monotonic time the request starts at."""
+        if self._has_room() and not self._waiters:
+            self.in_flight += 1
+            return time.monotonic()
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # the slot was handed over just before the cancellation
+                self.in_flight -= 1
+                self._wake()
+            else:
+                self._waiters.remove(waiter)
+            raise
+        return time.monotonic()
+
+    def _record(self, reason: str):
+        self.history.append((time.time(), int(self.limit), reason))
+
+    def release(self, started: float, *, overloaded: bool = False, sample: bool = True):
+        """
+        Free a slot and adjust the limit from the request's outcome.
+
+        :param started: Value returned by :meth:`acquire`
+        :param overloaded: The platform throttled or timed out the request
+        :param sample: Whether the outcome says anything about platform load
+        """
+        now = time.monotonic()
+        latency = now - started
+        saturated = self.in_flight >= int(self.limit)
+        self.in_flight -= 1
+
+        if sample:
+            spike = self.baseline is not None and latency > self.baseline * self.latency_tolerance
+            if not overloaded:
+                self.baseline = latency if self.baseline is None else (
+                    self.baseline + self.smoothing * (latency - self.baseline))
+
+            if overloaded or spike:
+                if started >= self._last_decrease and self.limit > self.min_limit:
+                    self.limit = max(self.min_limit, self.limit * self.backoff_ratio)
+                    self._last_decrease = now
+                    self.decreases += 1
+                    self._record("overload" if overloaded else "latency")
+            elif saturated and self.limit < self.max_limit:
+                before = int(self.limit)
+                self.limit = min(self.max_limit, self.limit + 1 / self.limit)
+                if int(self.limit) > before:
+                    self.increases += 1
+                    self._record("increase")
+
+        self._wake()
+
+    def stats(self) -> dict:
+        return {
+            "limit": int(self.limit),
+            "in_flight": self.in_flight,
+            "waiting": len(self._waiters),
+            "baseline_latency": round(self.baseline, 4) if self.baseline is not None else None,
+            "increases": self.increases,
+            "decreases": self.decreases,
+            "history": [
+                {"time": at, "limit": limit, "reason": reason}
+                for at, limit, reason in self.history
+            ],
+        }
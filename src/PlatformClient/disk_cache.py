@@ -0,0 +1,243 @@
+import asyncio
+import json
+import os
+import sqlite3
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Iterable, Optional
+
+from .cache import CacheEntry
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    endpoint TEXT NOT NULL,
+    fields TEXT NOT NULL,
+    status INTEGER NOT NULL,
+    reason TEXT NOT NULL,
+    headers TEXT NOT NULL,
+    body BLOB NOT NULL,
+    expires_at REAL NOT NULL,
+    accessed_at REAL NOT NULL,
+    size INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS responses_endpoint ON responses (endpoint);
+CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed_at);
+"""
+
+
+def _has_validators(headers: str) -> bool:
+    return any(name.lower() in ("etag", "last-modified") for name, _ in json.loads(headers))
+
+
+class DiskCache:
+    """
+    SQLite tier below :class:`~PlatformClient.cache.ResponseCache` that survives restarts.
+
+    Rows keep their absolute expiry time, so a new process only reuses what is
+    still fresh (or within the memory cache's stale grace window). Every
+    ``compact_every`` writes, rows past ``keep_expired`` seconds after expiry
+    are deleted and the least recently read ones go until the file holds at
+    most ``max_bytes`` of responses. Expired rows with an ``ETag`` or
+    ``Last-Modified`` header are left to that size limit, like in memory, so
+    they can still be revalidated after a restart.
+
+    SQLite is only touched from a worker thread of its own: writes, deletes
+    and compaction are queued there in order, and :meth:`aget` awaits reads,
+    so the event loop never waits on the disk.
+
+    :param path: Database file; created with its parent directories if missing
+    :param max_bytes: Size cap for stored responses
+    :param keep_expired: How long expired rows without validators are kept around, in seconds
+    """
+
+    def __init__(self, path: str | os.PathLike, max_bytes: int = 64 * 1024 * 1024,
+                 keep_expired: float = 0.0, compact_every: int = 256):
+        if max_bytes < 1:
+            raise ValueError("max_bytes must be positive")
+
+        self.path = os.fspath(path)
+        self.max_bytes = max_bytes
+        self.keep_expired = keep_expired
+        self.compact_every = compact_every
+
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="PlatformClient-disk")
+        self._closed = False
+        self._db = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        # must precede table creation to take effect on a new file
+        self._db.execute("PRAGMA auto_vacuum=INCREMENTAL")
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript(_SCHEMA)
+        self._writes = 0
+        # kept up to date by the worker, so stats() never has to query the database
+        self._entries, self._bytes = self._db.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidated = 0
+        self.errors = 0
+
+        self._submit(self.compact)
+
+    def _submit(self, fn: Callable, *args) -> Optional[Future]:
+        if self._closed:
+            return None
+        future = self._executor.submit(fn, *args)
+        future.add_done_callback(self._background_done)
+        return future
+
+    def _background_done(self, future: Future):
+        if not future.cancelled() and future.exception() is not None:
+            # a failed write only costs a future cache miss
+            self.errors += 1
+
+    async def aget(self, key: str) -> Optional[CacheEntry]:
+        """:meth:`get` on the disk worker, after every write queued before it."""
+        if self._closed:
+            return None
+        return await asyncio.get_running_loop().run_in_executor(self._executor, self.get, key)
+
+    def flush(self):
+        """Block until every queued write has reached the database."""
+        future = self._submit(lambda: None)
+        if future is not None:
+            future.result()
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        now = time.time()
+        with self._lock:
+            row = self._db.execute(
+                "SELECT endpoint, fields, status, reason, headers, body, expires_at "
+                "FROM responses WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self._db.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key))
+            self.hits += 1
+
+        endpoint, fields, status, reason, headers, body, expires_at = row
+        return CacheEntry(endpoint, json.loads(fields), status, reason,
+                          [tuple(header) for header in json.loads(headers)], body, expires_at)
+
+    def put(self, key: str, entry: CacheEntry):
+        """Queue a write of ``entry``; the row is serialised when the worker gets to it."""
+        self._submit(self._put, key, entry)
+
+    def _put(self, key: str, entry: CacheEntry):
+        with self._lock:
+            self._drop([key])
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, entry.endpoint, json.dumps(entry.fields), entry.status, entry.reason,
+                 json.dumps(entry.headers), entry.body, entry.expires_at, time.time(), entry.size),
+            )
+            self._entries += 1
+            self._bytes += entry.size
+            self._writes += 1
+            due = self._writes % self.compact_every == 0
+        if due:
+            self._submit(self.compact)
+
+    def delete(self, keys: Iterable[str]):
+        self._submit(self._delete, list(keys))
+
+    def _delete(self, keys: list[str]) -> int:
+        with self._lock:
+            return self._drop(keys)
+
+    def _drop(self, keys: Iterable[str]) -> int:
+        removed = 0
+        for key in keys:
+            row = self._db.execute("SELECT size FROM responses WHERE key = ?", (key,)).fetchone()
+            if row is not None:
+                self._db.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self._entries -= 1
+                self._bytes -= row[0]
+                removed += 1
+        return removed
+
+    def invalidate(self, prefixes: Iterable[str], matches: Callable[[dict[str, str]], bool]):
+        """Queue the removal of rows under ``prefixes`` whose fields satisfy ``matches``."""
+        self._submit(self._invalidate, list(prefixes), matches)
+
+    def _invalidate(self, prefixes: list[str], matches: Callable[[dict[str, str]], bool]):
+        stale = [key for key, fields in self.candidates(prefixes) if matches(fields)]
+        self.invalidated += self._delete(stale)
+
+    def candidates(self, prefixes: Iterable[str]) -> list[tuple[str, dict[str, str]]]:
+        """``(key, fields)`` of every row whose endpoint falls under one of ``prefixes``."""
+        rows = []
+        with self._lock:
+            for prefix in prefixes:
+                base = prefix.rstrip("/")
+                rows += self._db.execute(
+                    "SELECT key, fields FROM responses WHERE endpoint = ? OR substr(endpoint, 1, ?) = ?",
+                    (base, len(base) + 1, base + "/"),
+                ).fetchall()
+        return [(key, json.loads(fields)) for key, fields in rows]
+
+    def compact(self) -> int:
+        """Drop expired rows without validators and trim the table to ``max_bytes``; returns the number removed."""
+        with self._lock:
+            removed = self._drop([
+                key for key, headers in self._db.execute(
+                    "SELECT key, headers FROM responses WHERE expires_at < ?", (time.time() - self.keep_expired,)
+                ).fetchall()
+                if not _has_validators(headers)
+            ])
+
+            if self._bytes > self.max_bytes:
+                excess = self._bytes - self.max_bytes
+                victims = []
+                for key, size in self._db.execute("SELECT key, size FROM responses ORDER BY accessed_at"):
+                    victims.append(key)
+                    excess -= size
+                    if excess <= 0:
+                        break
+                removed += self._drop(victims)
+
+            self.evictions += removed
+            if removed:
+                self._db.execute("PRAGMA incremental_vacuum")
+                self._db.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        return removed
+
+    def clear(self):
+        self._submit(self._clear)
+
+    def _clear(self):
+        with self._lock:
+            self._db.execute("DELETE FROM responses")
+            self._entries = self._bytes = 0
+
+    def close(self):
+        """Finish the queued writes and close the database."""
+        if self._closed:
+            return
+        self._closed = True
+        self._executor.shutdown(wait=True)
+        with self._lock:
+            self._db.close()
+
+    def stats(self) -> dict:
+        return {
+            "entries": self._entries,
+            "bytes": self._bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "invalidated": self.invalidated,
+            "errors": self.errors,
+        }
@@ -0,0 +1,25 @@
+class PlatformClientError(Exception):
+    """Base class for errors raised by the client itself rather than by the platform."""
+
+
+class ResponseTooLargeError(PlatformClientError, ValueError):
+    def __init__(self, limit: int):
+        super().__init__(f"Response body exceeds max_body_size of {limit} bytes")
+        self.limit = limit
+
+
+class CircuitOpenError(PlatformClientError):
+    """Raised without contacting the platform while the circuit for an endpoint is open."""
+
+    def __init__(self, endpoint: str, retry_after: float):
+        super().__init__(f"Circuit for {endpoint} is open, retry in {retry_after:.1f}s")
+        self.endpoint = endpoint
+        self.retry_after = retry_after
+
+
+class PaginationError(PlatformClientError):
+    """Raised when a page of a paginated listing cannot be fetched or understood."""
+
+    def __init__(self, message: str, status: int | None = None):
+        super().__init__(message)
+        self.status = status
@@ -0,0 +1,101 @@
+import math
+from collections import deque
+from typing import Optional
+
+
+class _LatencyWindow:
+    __slots__ = ("samples", "delay", "pending")
+
+    def __init__(self, size: int):
+        self.samples: deque[float] = deque(maxlen=size)
+        self.delay: Optional[float] = None
+        self.pending = 0
+
+
+class HedgePolicy:
+    """
+    When to send a duplicate of a slow idempotent call.
+
+    Latencies are tracked per endpoint over the last ``window`` calls. Once
+    ``min_samples`` are known, a call that has not answered after the
+    ``percentile``-th latency gets a second copy and the first one to answer
+    wins. Every call earns ``budget`` of a hedge, so hedges never exceed that
+    share of the traffic (5% by default).
+
+    :param percentile: Latency percentile after which a hedge is sent
+    :param min_delay: Lower bound for the hedge delay, in seconds
+    :param budget: Maximum share of extra requests caused by hedging
+    :param burst: How many unused hedges may be saved up
+    """
+
+    def __init__(
+        self,
+        percentile: float = 95.0,
+        min_delay: float = 0.005,
+        budget: float = 0.05,
+        burst: float = 10.0,
+        window: int = 1000,
+        min_samples: int = 20,
+    ):
+        if not 0 < percentile < 100:
+            raise ValueError("percentile must be between 0 and 100")
+        if not 0 <= budget <= 1:
+            raise ValueError("budget must be between 0 and 1")
+
+        self.percentile = percentile
+        self.min_delay = min_delay
+        self.budget = budget
+        self.burst = burst
+        self.window = window
+        self.min_samples = min_samples
+
+        self._windows: dict[str, _LatencyWindow] = {}
+        self._credit = 0.0
+
+        self.calls = 0
+        self.hedged = 0
+        self.hedge_wins = 0
+        self.over_budget = 0
+
+    def observe(self, endpoint: str, latency: float):
+        window = self._windows.get(endpoint)
+        if window is None:
+            window = self._windows[endpoint] = _LatencyWindow(self.window)
+        window.samples.append(latency)
+        window.pending += 1
+        # re-sorting on every sample is wasteful, the percentile moves slowly
+        if window.pending >= 16 or window.delay is None:
+            window.pending = 0
+            if len(window.samples) >= self.min_samples:
+                ordered = sorted(window.samples)
+                rank = min(len(ordered) - 1, math.ceil(self.percentile / 100 * len(ordered)) - 1)
+                window.delay = max(self.min_delay, ordered[rank])
+
+    def delay(self, endpoint: str) -> Optional[float]:
+        """Hedge delay for ``endpoint``, or None while too few latencies are known."""
+        self.calls += 1
+        self._credit = min(self.burst, self._credit + self.budget)
+        window = self._windows.get(endpoint)
+        return window.delay if window is not None else None
+
+    def take_budget(self) -> bool:
+        """Spend one hedge from the budget if there is one left."""
+        if self._credit < 1:
+            self.over_budget += 1
+            return False
+        self._credit -= 1
+        self.hedged += 1
+        return True
+
+    def stats(self) -> dict:
+        return {
+            "calls": self.calls,
+            "hedged": self.hedged,
+            "hedge_wins": self.hedge_wins,
+            "over_budget": self.over_budget,
+            "delays": {
+                endpoint: round(window.delay, 4)
+                for endpoint, window in self._windows.items()
+                if window.delay is not None
+            },
+        }
@@ -0,0 +1,116 @@
+import json
+from typing import Iterable, Optional
+
+BRANCH_KEYS = ("companyBranchId",)
+BOARD_KEYS = ("companyBranchId", "boardId")
+TASK_KEYS = ("companyBranchId", "boardId", "taskId")
+API_KEYS = ("companyBranchId", "apiId")
+
+
+class InvalidationRule:
+    """
+    Read endpoints made stale by one mutating endpoint.
+
+    A cached read is dropped when its endpoint falls under one of ``reads`` and
+    every field of ``keys`` present in both request bodies has the same value.
+    Field names are compared case-insensitively, since the platform accepts
+    both ``boardId`` and ``BoardId``.
+    """
+
+    __slots__ = ("reads", "keys")
+
+    def __init__(self, reads: Iterable[str], keys: Iterable[str] = BRANCH_KEYS):
+        self.reads = tuple(reads)
+        self.keys = tuple(key.lower() for key in keys)
+
+
+def _board(*reads: str, keys: Iterable[str] = BOARD_KEYS) -> InvalidationRule:
+    return InvalidationRule((f"/CompanyBranchBoard/{read}" for read in reads), keys)
+
+
+_TASK_READS = ("GetTasks", "GetTaskDetails")
+# what a token may access changes with the API entries of its branch
+_ACCESS_READS = ("/CompanyBranch/GetAccess", "/Company/GetAccess")
+
+DEFAULT_INVALIDATIONS: dict[str, InvalidationRule] = {
+    "/CompanyBranchBoard/Create": _board("Get", keys=BRANCH_KEYS),
+    "/CompanyBranchBoard/Edit": _board("Get", "GetDetails"),
+    "/CompanyBranchBoard/Remove": _board("Get", "GetDetails", "GetTags", "GetStates", "GetSprints", *_TASK_READS),
+    "/CompanyBranchBoard/CreateTag": _board("GetTags"),
+    "/CompanyBranchBoard/EditTag": _board("GetTags", *_TASK_READS),
+    "/CompanyBranchBoard/RemoveTag": _board("GetTags", *_TASK_READS),
+    "/CompanyBranchBoard/CreateState": _board("GetStates"),
+    "/CompanyBranchBoard/EditState": _board("GetStates"),
+    "/CompanyBranchBoard/RemoveState": _board("GetStates", *_TASK_READS),
+    "/CompanyBranchBoard/CreateSprint": _board("GetSprints"),
+    "/CompanyBranchBoard/EditSprint": _board("GetSprints"),
+    "/CompanyBranchBoard/RemoveSprint": _board("GetSprints", *_TASK_READS),
+    "/CompanyBranchBoard/CreateTask": _board("GetTasks"),
+    "/CompanyBranchBoard/SetTaskOrder": _board("GetTasks"),
+    "/CompanyBranchBoard/EditTaskName": _board(*_TASK_READS, keys=TASK_KEYS),
+    "/CompanyBranchBoard/EditTaskDescription": _board(*_TASK_READS, keys=TASK_KEYS),
+    "/CompanyBranchBoard/EditTaskEndTime": _board(*_TASK_READS, keys=TASK_KEYS),
+    "/CompanyBranchBoard/EditTaskManager": _board(*_TASK_READS, keys=TASK_KEYS),
+    "/CompanyBranchBoard/RemoveTask": _board(*_TASK_READS, "GetTaskComments", keys=TASK_KEYS),
+    "/CompanyBranchBoard/AddTaskTag": _board(*_TASK_READS, keys=TASK_KEYS),
+    "/CompanyBranchBoard/RemoveTaskTag": _board(*_TASK_READS, keys=TASK_KEYS),
+    "/CompanyBranchBoard/AddTaskStudent": _board(*_TASK_READS, keys=TASK_KEYS),
+    "/CompanyBranchBoard/RemoveTaskStudent": _board(*_TASK_READS, keys=TASK_KEYS),
+    "/CompanyBranchBoard/CreateSubTask": _board(*_TASK_READS, keys=TASK_KEYS),
+    "/CompanyBranchBoard/EditSubTaskContent": _board(*_TASK_READS, keys=TASK_KEYS),
+    "/CompanyBranchBoard/RemoveSubTask": _board(*_TASK_READS, keys=TASK_KEYS),
+    "/CompanyBranchBoard/CreateTaskComment": _board("GetTaskComments", keys=TASK_KEYS),
+    "/CompanyBranchBoard/EditTaskComment": _board("GetTaskComments", keys=TASK_KEYS),
+    "/CompanyBranchBoard/RemoveTaskComment": _board("GetTaskComments", keys=TASK_KEYS),
+    "/CompanyBranchBoard/SetVariable": _board("GetVariables"),
+    "/CompanyBranchAPI/Create": InvalidationRule(["/CompanyBranchAPI/Get"]),
+    "/CompanyBranchAPI/Edit": InvalidationRule(
+        ["/CompanyBranchAPI/Get", "/CompanyBranchAPI/GetDetails", *_ACCESS_READS], API_KEYS),
+    "/CompanyBranchAPI/ResetToken": InvalidationRule(["/CompanyBranchAPI/GetDetails", *_ACCESS_READS], API_KEYS),
+    "/CompanyBranchAPI/Remove": InvalidationRule(
+        ["/CompanyBranchAPI/Get", "/CompanyBranchAPI/GetDetails", "/CompanyBranchAPI/GetVariables", *_ACCESS_READS],
+        API_KEYS),
+    "/CompanyBranchAPI/SetVariable": InvalidationRule(["/CompanyBranchAPI/GetVariables"], API_KEYS),
+    "/CompanyBranchAPI/SetVariables": InvalidationRule(["/CompanyBranchAPI/GetVariables"], API_KEYS),
+}
+
+
+def body_fields(body: dict | str | None) -> dict[str, str]:
+    """Top-level scalar fields of a request body, with lower-cased names."""
+    if isinstance(body, str):
+        try:
+            body = json.loads(body)
+        except ValueError:
+            return {}
+    if not isinstance(body, dict):
+        return {}
+    return {
+        str(name).lower(): str(value)
+        for name, value in body.items()
+        if not isinstance(value, (dict, list)) and value is not None
+    }
+
+
+class InvalidationMap:
+    """
+    Which cached reads a mutating call makes stale.
+
+    Mutations without an explicit rule fall back to dropping every cached read
+    of the same controller (``/CompanyBranchLead`` for ``/CompanyBranchLead/Edit``)
+    in the same branch. Reads of other controllers that such a mutation affects
+    are left alone, so those mutations need an explicit rule.
+
+    :param rules: Mutation endpoint -> rule; defaults to :data:`DEFAULT_INVALIDATIONS`
+    :param fallback: Invalidate the whole controller for mutations without a rule
+    """
+
+    def __init__(self, rules: Optional[dict[str, InvalidationRule]] = None, fallback: bool = True):
+        self.rules = dict(DEFAULT_INVALIDATIONS if rules is None else rules)
+        self.fallback = fallback
+
+    def rule_for(self, endpoint: str) -> Optional[InvalidationRule]:
+        rule = self.rules.get(endpoint)
+        if rule is None and self.fallback:
+            controller = "/" + endpoint.strip("/").split("/", 1)[0]
+            rule = InvalidationRule([controller])
+        return rule
@@ -0,0 +1,150 @@
+import re
+from typing import Iterator, Optional
+
+_WHITESPACE = b" \t\r\n"
+_STRING_SPECIAL = re.compile(rb'["\\]')
+
+_QUOTE = 0x22
+_BACKSLASH = 0x5C
+
+
+class ItemScanner:
+    """
+    Incremental scanner that cuts the elements of one JSON array out of a byte stream.
+
+    The array is addressed by a dotted path of object keys (``"data.items"``;
+    an empty path means the document itself is the array). Chunks are passed
+    to :meth:`feed` as they arrive and every complete element comes back as raw
+    bytes, so only the element currently being scanned is buffered. Everything
+    around the target array is skipped without being parsed.
+    """
+
+    def __init__(self, path: str = "data.items"):
+        self.path: tuple[str, ...] = tuple(part for part in path.split(".") if part)
+        self.found = False
+        self.done = False
+
+        # one [kind, current key] entry per open container
+        self._stack: list[list] = []
+        self._expect_key = False
+        self._in_string = False
+        self._escape = False
+        self._key: Optional[bytearray] = None
+
+        self._target_depth = -1
+        self._capture: Optional[str] = None
+        self._item = bytearray()
+
+    def _is_target(self) -> bool:
+        parents = self._stack[:-1]
+        return (
+            len(parents) == len(self.path)
+            and all(kind == "{" for kind, _ in parents)
+            and tuple(key for _, key in parents) == self.path
+        )
+
+    def _emit(self, data: bytes, start: int, end: int) -> bytes:
+        self._item += data[start:end]
+        item = bytes(self._item)
+        self._item.clear()
+        self._capture = None
+        return item
+
+    def feed(self, data: bytes) -> Iterator[bytes]:
+        """Scan the next chunk and yield the raw bytes of every element it completes."""
+        if self.done:
+            return
+
+        start = 0 if self._capture is not None else None
+        i, n = 0, len(data)
+
+        while i < n:
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                    if self._key is not None:
+                        self._key.append(data[i])
+                    i += 1
+                    continue
+
+                match = _STRING_SPECIAL.search(data, i)
+                end = match.start() if match else n
+                if self._key is not None:
+                    self._key += data[i:end]
+                if match is None:
+                    i = n
+                    continue
+
+                if data[end] == _BACKSLASH:
+                    if self._key is not None:
+                        self._key.append(_BACKSLASH)
+                    self._escape = True
+                    i = end + 1
+                    continue
+
+                # closing quote
+                self._in_string = False
+                i = end + 1
+                if self._key is not None:
+                    self._stack[-1][1] = self._key.decode("utf-8")
+                    self._key = None
+                elif self._capture == "string" and len(self._stack) == self._target_depth:
+                    yield self._emit(data, start, i)
+                    start = None
+                continue
+
+            byte = data[i]
+
+            if self._capture == "scalar" and (byte in b",]}" or byte in _WHITESPACE):
+                yield self._emit(data, start, i)
+                start = None
+
+            if byte in _WHITESPACE:
+                i += 1
+                continue
+
+            if (self._capture is None and len(self._stack) == self._target_depth
+                    and byte not in b",]"):
+                start = i
+                if byte in b"{[":
+                    self._capture = "container"
+                elif byte == _QUOTE:
+                    self._capture = "string"
+                else:
+                    self._capture = "scalar"
+
+            if byte == _QUOTE:
+                self._in_string = True
+                if self._expect_key:
+                    self._expect_key = False
+                    self._key = bytearray()
+            elif byte in b"{[":
+                self._stack.append([chr(byte), None])
+                self._expect_key = byte == 0x7B
+                if byte == 0x5B and not self.found and self._is_target():
+                    self.found = True
+                    self._target_depth = len(self._stack)
+            elif byte in b"}]":
+                if self._capture is None and len(self._stack) == self._target_depth:
+                    self.done = True
+                    return
+                self._stack.pop()
+                self._expect_key = False
+                if self._capture == "container" and len(self._stack) == self._target_depth:
+                    yield self._emit(data, start, i + 1)
+                    start = None
+            elif byte == 0x2C and self._stack and self._stack[-1][0] == "{":
+                self._stack[-1][1] = None
+                self._expect_key = True
+
+            i += 1
+
+        if start is not None and self._capture is not None:
+            self._item += data[start:]
+
+    def close(self):
+        """Check that the stream ended after the whole target array."""
+        if not self.found:
+            raise ValueError(f"No JSON array found at path {'.'.join(self.path)!r}")
+        if not self.done:
+            raise ValueError("JSON stream ended before the array was complete")
@@ -14,6 +14,12 @@ class BaseMethods:
     def __init__(self, client: "PlatformClient"):
         self.client = client
 
+    def paging(self, action: str) -> dict:
+        """Options that let the paginator tune page sizes of ``action`` with the client's sizer."""
+        if self.client.page_sizer is None:
+            return {}
+        return {"sizer": self.client.page_sizer, "endpoint": f"{self.path}/{action}"}
+
 T_Methods = TypeVar("T_Methods", bound=BaseMethods)
 
 class BaseClass(Generic[T_Methods]):
@@ -1,6 +1,7 @@
 from http.client import HTTPResponse
 from typing import TYPE_CHECKING
 
+from ..paginator import paginate
 from ..query_builder import QueryBuilder
 from ..types import SafeUUID, UserAccess
 from ._default import BaseMethods, BaseClass
@@ -156,6 +157,9 @@ class BoundAPIMethods:
     async def GetList(self, filter_query=None):
         return await self.methods.GetList(self.branch_id, filter_query)
 
+    def iterate(self, filter_query=None, **options):
+        return paginate(self.GetList, filter_query, **{**self.methods.paging("Get"), **options})
+
     async def Create(self, name: str, access: list[UserAccess]):
         return await self.methods.Create(self.branch_id, name, access)
 
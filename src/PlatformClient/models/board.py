@@ -1,4 +1,5 @@
 from typing import TYPE_CHECKING
+from ..paginator import paginate
 from ..query_builder import QueryBuilder
 from ..types import SafeUUID
 from ._default import BaseMethods, BaseClass
@@ -833,6 +834,9 @@ class BoundBoardMethods:
     async def Get(self, filter_query=None):
         return await self.methods.Get(self.branch_id, filter_query)
 
+    def iterate(self, filter_query=None, **options):
+        return paginate(self.Get, filter_query, **{**self.methods.paging("Get"), **options})
+
     async def GetDetails(self, board_id: SafeUUID | str):
         return await self.methods.GetDetails(self.branch_id, board_id)
 
@@ -865,6 +869,10 @@ class BoundBoardMethods:
         return await self.methods.GetTags(self.branch_id, board_id,
                                           filter_query)
 
+    def iterate_tags(self, board_id: SafeUUID | str, filter_query=None, **options):
+        return paginate(lambda query: self.GetTags(board_id, query), filter_query,
+                        **{**self.methods.paging("GetTags"), **options})
+
     async def CreateTag(self, board_id: SafeUUID | str, name: str):
         return await self.methods.CreateTag(self.branch_id, board_id, name)
 
@@ -882,6 +890,10 @@ class BoundBoardMethods:
                                             board_id,
                                             filter_query)
 
+    def iterate_states(self, board_id: SafeUUID | str, filter_query=None, **options):
+        return paginate(lambda query: self.GetStates(board_id, query), filter_query,
+                        **{**self.methods.paging("GetStates"), **options})
+
     async def CreateState(self, board_id: SafeUUID | str, name: str):
         return await self.methods.CreateState(self.branch_id, board_id, name)
 
@@ -902,6 +914,10 @@ class BoundBoardMethods:
                                              board_id,
                                              filter_query)
 
+    def iterate_sprints(self, board_id: SafeUUID | str, filter_query=None, **options):
+        return paginate(lambda query: self.GetSprints(board_id, query), filter_query,
+                        **{**self.methods.paging("GetSprints"), **options})
+
     async def CreateSprint(self,
                            board_id: SafeUUID | str,
                            name: str,
@@ -944,6 +960,10 @@ class BoundBoardMethods:
         return await self.methods.GetTasks(self.branch_id, board_id,
                                            filter_query)
 
+    def iterate_tasks(self, board_id: SafeUUID | str, filter_query=None, **options):
+        return paginate(lambda query: self.GetTasks(board_id, query), filter_query,
+                        **{**self.methods.paging("GetTasks"), **options})
+
     async def GetTaskDetails(self, board_id: SafeUUID | str,
                              task_id: SafeUUID | str):
         return await self.methods.GetTaskDetails(self.branch_id, board_id,
@@ -995,6 +1015,11 @@ class BoundBoardMethods:
         return await self.methods.GetTaskComments(self.branch_id, board_id,
                                                   task_id, filter_query)
 
+    def iterate_task_comments(self, board_id: SafeUUID | str, task_id: SafeUUID | str,
+                              filter_query=None, **options):
+        return paginate(lambda query: self.GetTaskComments(board_id, task_id, query), filter_query,
+                        **{**self.methods.paging("GetTaskComments"), **options})
+
     async def CreateTaskComment(self, board_id: SafeUUID | str,
                                 task_id: SafeUUID | str, content: str):
         return await self.methods.CreateTaskComment(self.branch_id, board_id,
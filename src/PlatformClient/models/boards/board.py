@@ -3,6 +3,7 @@ from typing import TYPE_CHECKING, List
 
 from .sprint import SprintClass
 from .task import TaskClass
+from ...paginator import paginate
 from ...query_builder import QueryBuilder
 from ...types import SafeUUID, UserAccess
 from .._default import BaseMethods, BaseClass
@@ -176,6 +177,9 @@ class BoundBoardMethods:
     async def GetList(self, filter_query=None):
         return await self.methods.GetList(self.branch_id, filter_query)
 
+    def iterate(self, filter_query=None, **options):
+        return paginate(self.GetList, filter_query, **{**self.methods.paging("Get"), **options})
+
     async def GetDetails(self, role_id: SafeUUID | str):
         return await self.methods.GetDetails(self.branch_id, role_id)
 
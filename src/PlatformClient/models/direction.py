@@ -1,5 +1,6 @@
 from http.client import HTTPResponse
 from typing import TYPE_CHECKING
+from ..paginator import paginate
 from ..query_builder import QueryBuilder
 from ..types import SafeUUID
 from ._default import BaseMethods, BaseClass
@@ -65,6 +66,9 @@ class BoundDirectionMethods:
     async def Get(self, filter_query=None):
         return await self.methods.Get(self.branch_id, filter_query)
 
+    def iterate(self, filter_query=None, **options):
+        return paginate(self.Get, filter_query, **{**self.methods.paging("Get"), **options})
+
     async def GetDetails(self, direction_id: SafeUUID | str):
         return await self.methods.GetDetails(self.branch_id, direction_id)
 
@@ -1,6 +1,7 @@
 from http.client import HTTPResponse
 from typing import TYPE_CHECKING, List, Dict, Optional
 
+from ..paginator import paginate
 from ..query_builder import QueryBuilder
 from ..types import SafeUUID
 from ._default import BaseMethods, BaseClass
@@ -148,6 +149,10 @@ class BoundGroupMethods:
         """Get groups with optional filter"""
         return await self.methods.Get(self.branch_id, filter_query)
 
+    def iterate(self, filter_query=None, **options):
+        """Iterate over all groups, page by page"""
+        return paginate(self.Get, filter_query, **{**self.methods.paging("Get"), **options})
+
     async def GetDetails(self, group_id: SafeUUID | str):
         """Get group details by ID"""
         return await self.methods.GetDetails(self.branch_id, group_id)
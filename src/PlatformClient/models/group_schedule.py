@@ -1,12 +1,10 @@
 from http.client import HTTPResponse
 from typing import TYPE_CHECKING
 
-from app.libs.platforma.PlatformClient.models._default import (
-    BaseMethods,
-    BaseClass
-)
-from app.libs.platforma.PlatformClient.query_builder import QueryBuilder
-from app.libs.platforma.PlatformClient.types import SafeUUID
+from ._default import BaseMethods, BaseClass
+from ..paginator import paginate
+from ..query_builder import QueryBuilder
+from ..types import SafeUUID
 
 if TYPE_CHECKING:
     from ..client import PlatformClient
@@ -103,6 +101,10 @@ class BoundGroupScheduleMethods:
     async def Get(self, group_id: SafeUUID | str, filter_query=None):
         return await self.methods.Get(self.branch_id, group_id, filter_query)
 
+    def iterate(self, group_id: SafeUUID | str, filter_query=None, **options):
+        return paginate(lambda query: self.Get(group_id, query), filter_query,
+                        **{**self.methods.paging("Get"), **options})
+
     async def GetDetails(self, group_id: SafeUUID | str, data: SafeUUID | str):
         return await self.methods.GetDetails(self.branch_id, group_id, data)
 
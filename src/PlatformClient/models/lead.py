@@ -1,6 +1,7 @@
 from http.client import HTTPResponse
 from typing import TYPE_CHECKING
 
+from ..paginator import paginate
 from ..query_builder import QueryBuilder
 from ..types import SafeUUID, UserAccess
 from ._default import BaseMethods, BaseClass
@@ -89,6 +90,10 @@ class BoundLeadMethods:
     async def GetList(self, filter_query=None, is_my: bool = False):
         return await self.methods.GetList(self.branch_id, filter_query, is_my=is_my)
 
+    def iterate(self, filter_query=None, is_my: bool = False, **options):
+        return paginate(lambda query: self.GetList(query, is_my=is_my), filter_query,
+                        **{**self.methods.paging("GetMy" if is_my else "Get"), **options})
+
     async def GetDetails(self, lead_id: SafeUUID | str):
         return await self.methods.GetDetails(self.branch_id, lead_id)
 
@@ -99,6 +104,10 @@ class BoundLeadMethods:
             filter_query=filter_query
         )
 
+    def iterate_lead_groups(self, lead_id: SafeUUID | str, filter_query=None, **options):
+        return paginate(lambda query: self.GetLeadGroups(lead_id, query), filter_query,
+                        **{**self.methods.paging("GetLeadGroups"), **options})
+
 
 class LeadClass(BaseClass[LeadMethods]):
     BranchId: SafeUUID
@@ -1,6 +1,7 @@
 from http.client import HTTPResponse
 from typing import TYPE_CHECKING
 
+from ..paginator import paginate
 from ..query_builder import QueryBuilder
 from ..types import SafeUUID, UserAccess
 from ._default import BaseMethods, BaseClass
@@ -53,6 +54,9 @@ class BoundManagerMethods:
     async def GetList(self, filter_query=None):
         return await self.methods.GetList(self.branch_id, filter_query)
 
+    def iterate(self, filter_query=None, **options):
+        return paginate(self.GetList, filter_query, **{**self.methods.paging("Get"), **options})
+
     async def GetDetails(self, manager_id: SafeUUID | str):
         return await self.methods.GetDetails(self.branch_id, manager_id)
 
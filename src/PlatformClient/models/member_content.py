@@ -1,6 +1,7 @@
 from typing import TYPE_CHECKING, Literal, Any, Dict
 from http.client import HTTPResponse
 
+from ..paginator import paginate
 from ..query_builder import QueryBuilder
 from ..types import SafeUUID
 from ._default import BaseMethods, BaseClass
@@ -146,9 +147,17 @@ class BoundMemberContent:
     async def GetAccessGrants(self, kind: ContentKind, filter_query = None):
         return await self.methods.GetAccessGrants(self.branch_id, kind, filter_query)
 
+    def iterate_access_grants(self, kind: ContentKind, filter_query=None, **options):
+        return paginate(lambda query: self.GetAccessGrants(kind, query), filter_query,
+                        **{**self.methods.paging(f"Get{_kind_token(kind)}AccessGrants"), **options})
+
     async def GetAccessGrantHistory(self, kind: ContentKind, filter_query = None):
         return await self.methods.GetAccessGrantHistory(self.branch_id, kind, filter_query)
 
+    def iterate_access_grant_history(self, kind: ContentKind, filter_query=None, **options):
+        return paginate(lambda query: self.GetAccessGrantHistory(kind, query), filter_query,
+                        **{**self.methods.paging(f"Get{_kind_token(kind)}AccessGrantHistory"), **options})
+
     async def AccessGrant(self, kind: ContentKind, data: dict):
         return await self.methods.AccessGrant(self.branch_id, kind, data)
 
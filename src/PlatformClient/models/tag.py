@@ -2,6 +2,7 @@ from http.client import HTTPResponse
 from typing import TYPE_CHECKING
 
 from ._default import BaseMethods, BaseClass
+from ..paginator import paginate
 from ..query_builder import QueryBuilder
 from ..types import SafeUUID
 
@@ -50,6 +51,9 @@ class BoundTagMethods:
     async def Get(self, filter_query=None):
         return await self.methods.Get(self.branch_id, filter_query)
 
+    def iterate(self, filter_query=None, **options):
+        return paginate(self.Get, filter_query, **{**self.methods.paging("Get"), **options})
+
     async def GetDetails(self, tag_id: SafeUUID | str):
         return await self.methods.GetDetails(self.branch_id, tag_id)
 
@@ -1,6 +1,7 @@
 from http.client import HTTPResponse
 from typing import TYPE_CHECKING
 
+from ..paginator import paginate
 from ..query_builder import QueryBuilder
 from ..types import SafeUUID, UserAccess
 from ._default import BaseMethods, BaseClass
@@ -112,6 +113,10 @@ class BoundTeacherMethods:
         return await self.methods.GetList(self.branch_id, filter_query,
                                           is_my=is_my)
 
+    def iterate(self, filter_query=None, is_my: bool = False, **options):
+        return paginate(lambda query: self.GetList(query, is_my=is_my), filter_query,
+                        **{**self.methods.paging("GetMy" if is_my else "Get"), **options})
+
     async def GetDetails(self, teacher_id: SafeUUID | str):
         return await self.methods.GetDetails(self.branch_id, teacher_id)
 
@@ -120,6 +125,10 @@ class BoundTeacherMethods:
         return await self.methods.GetScheduleItemList(self.branch_id,
                                                       teacher_id, filter_query)
 
+    def iterate_schedule_items(self, teacher_id: SafeUUID | str, filter_query=None, **options):
+        return paginate(lambda query: self.GetScheduleItemList(teacher_id, query), filter_query,
+                        **{**self.methods.paging("GetScheduleItemList"), **options})
+
     async def GetSchedule(self, teacher_id: SafeUUID | str, filter_query=None):
         return await self.methods.GetSchedule(self.branch_id, teacher_id,
                                               filter_query)
@@ -0,0 +1,124 @@
+from typing import Optional
+
+# answers that suggest the page asked for too much at once
+OVERSIZE_STATUSES = frozenset({408, 413, 500, 502, 503, 504})
+
+
+class _PageSize:
+    __slots__ = ("size", "max_size", "latency", "body_bytes", "grown", "shrunk")
+
+    def __init__(self, size: int, max_size: int):
+        self.size = size
+        # lowered to the platform's own cap on Count once one shows up
+        self.max_size = max_size
+        self.latency: Optional[float] = None
+        self.body_bytes: Optional[int] = None
+        self.grown = 0
+        self.shrunk = 0
+
+
+class PageSizer:
+    """
+    ``Count`` per list endpoint, tuned from how long pages take and how big they are.
+
+    After every full page the size is scaled by how far the response was from
+    ``target_latency`` and ``target_bytes``, whichever is tighter, at most
+    doubling or halving per page. Pages within ``tolerance`` of the target keep
+    their size, and an error or timeout halves it. The learned sizes stay with
+    the client, so the next walk over the same endpoint starts from them.
+
+    When a full-size request comes back short although the listing goes on,
+    the platform caps ``Count`` for that endpoint; :meth:`capped` then makes
+    the returned count the endpoint's ceiling.
+
+    :param initial_size: Page size for an endpoint seen for the first time
+    :param target_latency: Desired time per page request, in seconds
+    :param target_bytes: Desired decoded body size per page
+    :param tolerance: Relative distance from the target that is left alone
+    """
+
+    def __init__(
+        self,
+        initial_size: int = 100,
+        min_size: int = 10,
+        max_size: int = 1000,
+        target_latency: float = 1.0,
+        target_bytes: int = 1024 * 1024,
+        tolerance: float = 0.25,
+        oversize_statuses: frozenset[int] = OVERSIZE_STATUSES,
+    ):
+        if not 1 <= min_size <= initial_size <= max_size:
+            raise ValueError("Sizes must satisfy 1 <= min_size <= initial_size <= max_size")
+        if target_latency <= 0 or target_bytes <= 0:
+            raise ValueError("target_latency and target_bytes must be positive")
+
+        self.initial_size = initial_size
+        self.min_size = min_size
+        self.max_size = max_size
+        self.target_latency = target_latency
+        self.target_bytes = target_bytes
+        self.tolerance = tolerance
+        self.oversize_statuses = oversize_statuses
+
+        self._endpoints: dict[str, _PageSize] = {}
+
+    def _state(self, endpoint: str) -> _PageSize:
+        state = self._endpoints.get(endpoint)
+        if state is None:
+            state = self._endpoints[endpoint] = _PageSize(self.initial_size, self.max_size)
+        return state
+
+    def size_for(self, endpoint: str) -> int:
+        return self._state(endpoint).size
+
+    def observe(self, endpoint: str, count: int, returned: int, latency: float, body_bytes: int):
+        """
+        Account one page request of ``count`` items that answered with ``returned`` items.
+
+        Short pages (the end of a listing) say little about the cost of a full
+        one and are only recorded, not acted on.
+        """
+        state = self._state(endpoint)
+        state.latency = latency
+        state.body_bytes = body_bytes
+        if returned < count or count != state.size:
+            return
+
+        factor = self.target_latency / max(latency, 1e-6)
+        if body_bytes:
+            factor = min(factor, self.target_bytes / body_bytes)
+        if abs(factor - 1) <= self.tolerance:
+            return
+        self._resize(state, state.size * min(2.0, max(0.5, factor)))
+
+    def failed(self, endpoint: str):
+        """A page request timed out or was rejected as too large; halve the page size."""
+        state = self._state(endpoint)
+        self._resize(state, state.size / 2)
+
+    def capped(self, endpoint: str, size: int):
+        """The platform answered a request for more rows with only ``size`` while more were left."""
+        state = self._state(endpoint)
+        state.max_size = max(1, min(state.max_size, size))
+        self._resize(state, state.size)
+
+    def _resize(self, state: _PageSize, size: float):
+        size = max(min(self.min_size, state.max_size), min(state.max_size, int(size)))
+        if size > state.size:
+            state.grown += 1
+        elif size < state.size:
+            state.shrunk += 1
+        state.size = size
+
+    def stats(self) -> dict:
+        return {
+            endpoint: {
+                "size": state.size,
+                "max_size": state.max_size,
+                "latency": state.latency,
+                "body_bytes": state.body_bytes,
+                "grown": state.grown,
+                "shrunk": state.shrunk,
+            }
+            for endpoint, state in self._endpoints.items()
+        }
@@ -0,0 +1,441 @@
+import asyncio
+import functools
+import time
+from typing import TYPE_CHECKING, Any, AsyncIterator, Awaitable, Callable, Optional, Sequence
+
+from .exceptions import PaginationError, ResponseTooLargeError
+from .query_builder import QueryBuilder
+from .utils import PlatformResponse
+
+if TYPE_CHECKING:
+    from .pagesize import PageSizer
+
+ITEM_KEYS = ("items", "list", "results", "rows", "data")
+TOTAL_KEYS = ("count", "total", "totalCount", "total_count")
+
+PageFetcher = Callable[[QueryBuilder], Awaitable[PlatformResponse]]
+Resize = Callable[[], int]
+Capped = Callable[[int], None]
+
+DEFAULT_PAGE_SIZE = 100
+
+
+def extract_page(payload: Any) -> tuple[list, Optional[int]]:
+    """
+    Items and total count of one page of a list endpoint.
+
+    Accepts a bare list or an object with the list under one of
+    :data:`ITEM_KEYS`, optionally wrapped in ``data`` (``{"data": {"items": [...],
+    "count": 1234}}``). The total is None when the response does not carry one.
+    """
+    if isinstance(payload, list):
+        return payload, None
+    if not isinstance(payload, dict):
+        raise PaginationError(f"Unexpected page payload: {type(payload).__name__}")
+
+    for candidate in (payload, payload.get("data")):
+        if isinstance(candidate, list):
+            return candidate, None
+        if not isinstance(candidate, dict):
+            continue
+        items = next((candidate[key] for key in ITEM_KEYS if isinstance(candidate.get(key), list)), None)
+        if items is None:
+            continue
+        total = next((candidate[key] for key in TOTAL_KEYS if isinstance(candidate.get(key), int)), None)
+        return items, total
+
+    raise PaginationError(f"No item list found in page with keys {sorted(payload)}")
+
+
+async def fetch_page(fetch: PageFetcher, query: QueryBuilder) -> tuple[list, Optional[int]]:
+    response = await fetch(query)
+    if not response.ok:
+        raise PaginationError(f"Page at offset {query.offset} failed with status {response.status}", response.status)
+    return extract_page(response.json())
+
+
+def measured(fetch: PageFetcher, sizer: "PageSizer", endpoint: str) -> PageFetcher:
+    """``fetch`` reporting the latency and body size of every page to ``sizer``."""
+
+    async def fetch_measured(query: QueryBuilder) -> PlatformResponse:
+        started = time.monotonic()
+        try:
+            response = await fetch(query)
+        except (TimeoutError, asyncio.TimeoutError, ResponseTooLargeError):
+            sizer.failed(endpoint)
+            raise
+        if response.status in sizer.oversize_statuses:
+            sizer.failed(endpoint)
+        elif response.ok:
+            items, _ = extract_page(response.json())
+            sizer.observe(endpoint, query.count, len(items), time.monotonic() - started, len(response.bytes()))
+        return response
+
+    return fetch_measured
+
+
+async def _sequential_pages(fetch: PageFetcher, query: QueryBuilder, limit: Optional[int],
+                            resize: Optional[Resize] = None,
+                            capped: Optional[Capped] = None) -> AsyncIterator[list]:
+    """
+    One page after another, each requested while the previous one is being consumed.
+
+    :param resize: Gives the ``Count`` for the next request, if it may change between pages
+    :param capped: Told the number of rows a short page held when the listing went on after it
+    """
+    fetched = 0
+    # length of a short page whose successor decides whether it was the end or a cap
+    unconfirmed: Optional[int] = None
+
+    pending: Optional[asyncio.Future] = asyncio.ensure_future(fetch_page(fetch, query.copy()))
+    try:
+        while pending is not None:
+            items, total = await pending
+            pending = None
+            fetched += len(items)
+
+            if unconfirmed is not None and items and capped is not None:
+                capped(unconfirmed)
+            unconfirmed = None
+
+            offset = query.offset + len(items)
+            short = 0 < len(items) < query.count
+            if total is not None:
+                # the platform may cap Count below what was asked; a short page is not the end
+                more = bool(items) and offset < total
+                if short and more and capped is not None:
+                    capped(len(items))
+            else:
+                more = len(items) >= query.count
+                if short and resize is not None:
+                    # a tuned size may have outgrown a cap; only the next page can tell
+                    more, unconfirmed = True, len(items)
+            if limit is not None and fetched >= limit:
+                more = False
+            if more:
+                query.set_offset(offset)
+                if resize is not None:
+                    query.set_count(resize())
+                pending = asyncio.ensure_future(fetch_page(fetch, query.copy()))
+
+            yield items
+    finally:
+        _discard(pending)
+
+
+async def _fetch_window(fetch: PageFetcher, query: QueryBuilder, offset: int, size: int,
+                        capped: Optional[Capped] = None) -> list:
+    """The ``size`` rows from ``offset`` on, in as many requests as the platform's page cap needs."""
+    items = []
+    while len(items) < size:
+        page, _ = await fetch_page(fetch, query.copy().set_offset(offset + len(items)).set_count(size - len(items)))
+        if not page:
+            # the listing shrank since the windows were planned
+            break
+        if items and capped is not None:
+            capped(len(items))
+        items += page
+    return items
+
+
+async def _parallel_pages(fetch: PageFetcher, query: QueryBuilder, limit: Optional[int],
+                          concurrency: int, buffer_pages: int, probe: bool,
+                          capped: Optional[Capped] = None) -> AsyncIterator[list]:
+    """
+    Every page of a listing with a known total, ``concurrency`` requests at a time.
+
+    Pages are handed out in offset order. Finished pages wait in a reorder
+    buffer of at most ``buffer_pages`` until all pages before them have been
+    consumed, and no new requests start while it is full.
+
+    A first page shorter than asked for while the total is ahead reveals a
+    server-side cap on ``Count`` and the windows are planned with that size
+    instead. Any window that still comes back short is completed with
+    follow-up requests, so a cap never leaves holes.
+    """
+    page_size = query.count
+    start = query.offset
+
+    if probe:
+        _, total = await fetch_page(fetch, query.copy().set_count(1))
+        first = start
+    else:
+        items, total = await fetch_page(fetch, query.copy())
+        if total is None:
+            # nothing to plan with, carry on one page at a time
+            yield items
+            if len(items) >= page_size and (limit is None or len(items) < limit):
+                async for page in _sequential_pages(fetch, query.copy().set_offset(start + len(items)),
+                                                    None if limit is None else limit - len(items),
+                                                    capped=capped):
+                    yield page
+            return
+        yield items
+        if not items:
+            return
+        if len(items) < page_size and start + len(items) < total:
+            page_size = len(items)
+            if capped is not None:
+                capped(page_size)
+        first = start + len(items)
+
+    if total is None:
+        raise PaginationError("The probe request did not report a total count")
+
+    end = total if limit is None else min(total, start + limit)
+    offsets = range(first, end, page_size)
+    pages: dict[int, asyncio.Future] = {}
+    launched = 0
+    try:
+        for index, offset in enumerate(offsets):
+            while True:
+                running = [page for page in pages.values() if not page.done()]
+                while (launched < len(offsets) and len(running) < concurrency
+                       and launched - index < buffer_pages):
+                    window = offsets[launched]
+                    page = asyncio.ensure_future(
+                        _fetch_window(fetch, query, window, min(page_size, end - window), capped))
+                    pages[window] = page
+                    running.append(page)
+                    launched += 1
+                if pages[offset].done():
+                    break
+                await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+
+            yield pages.pop(offset).result()
+    finally:
+        for page in pages.values():
+            _discard(page)
+
+
+def key_value(item: Any, path: str) -> Any:
+    """
+    Value of a ``PropertyPath`` such as ``"CreatedAt"`` or ``"Course.Id"`` in a returned item.
+
+    Each segment is looked up as written and then with a lowercase first letter,
+    since the platform serialises ``CreatedAt`` as ``createdAt``.
+    """
+    value = item
+    for segment in path.split("."):
+        if not isinstance(value, dict):
+            raise PaginationError(f"Cannot read {path!r} from a page item")
+        for name in (segment, segment[:1].lower() + segment[1:]):
+            if name in value:
+                value = value[name]
+                break
+        else:
+            raise PaginationError(f"Page item has no {path!r} to continue the keyset from")
+    return value
+
+
+async def _keyset_pages(fetch: PageFetcher, query: QueryBuilder, keys: Sequence[str],
+                        compare_type: int, limit: Optional[int],
+                        resize: Optional[Resize] = None,
+                        capped: Optional[Capped] = None) -> AsyncIterator[list]:
+    """
+    Pages ordered by ``keys``, each one starting where the previous one ended.
+
+    The next page is filtered on ``keys[0] >= last value``. Rows sharing that
+    value are remembered by their full key, and the request skips all of them
+    but the last one read, via ``Offset``, which stays bounded by the size of
+    that group however deep the walk goes. The last row comes back first as
+    an anchor. If it does not, rows of the group were removed and unseen ones
+    may have shifted behind the offset, so the group is read again from its
+    start, anchored the same way, skipping what was already returned. Keys
+    are only compared for equality, never ordered on the client, since the
+    platform's ordering of dates or GUIDs need not match Python's.
+    """
+    base = query.copy().set_offset(0)
+    for path in keys:
+        base.order(path)
+
+    started = False
+    current: Any = None
+    seen: set[tuple] = set()
+    # offset of the next unread row of the current group, and the row before it
+    position = 0
+    last: Optional[tuple] = None
+
+    def next_page() -> QueryBuilder:
+        page = base.copy()
+        if resize is not None:
+            page.set_count(resize())
+        if started:
+            page.filter(keys[0], compare_type=compare_type, value=current)
+            page.set_offset(max(position - 1, 0))
+        return page
+
+    def key_of(item: Any) -> tuple:
+        return tuple(key_value(item, path) for path in keys)
+
+    fetched = 0
+    unconfirmed: Optional[int] = None
+    page = next_page()
+    pending: Optional[asyncio.Future] = asyncio.ensure_future(fetch_page(fetch, page))
+    try:
+        while pending is not None:
+            items, total = await pending
+            pending = None
+
+            if page.offset > 0 and (not items or key_of(items[0]) != last):
+                position = 0
+                page = next_page()
+                pending = asyncio.ensure_future(fetch_page(fetch, page))
+                continue
+
+            fresh = []
+            position = page.offset
+            for item in items:
+                key = key_of(item)
+                if started and key[0] == current:
+                    position += 1
+                    if key in seen:
+                        continue
+                    seen.add(key)
+                else:
+                    started, current, seen = True, key[0], {key}
+                    position = 1
+                fresh.append(item)
+            if items:
+                last = key_of(items[-1])
+
+            if unconfirmed is not None and fresh and capped is not None:
+                capped(unconfirmed)
+            unconfirmed = None
+
+            short = 0 < len(items) < page.count
+            if total is not None:
+                more = bool(items) and page.offset + len(items) < total
+                if short and more and capped is not None:
+                    capped(len(items))
+            else:
+                more = len(items) >= page.count
+                # a page of nothing but the anchor is the end either way
+                if short and resize is not None and fresh:
+                    more, unconfirmed = True, len(items)
+            fetched += len(fresh)
+            if limit is not None and fetched >= limit:
+                more = False
+            if more:
+                page = next_page()
+                pending = asyncio.ensure_future(fetch_page(fetch, page))
+
+            yield fresh
+    finally:
+        _discard(pending)
+
+
+def _discard(page: Optional[asyncio.Future]):
+    if page is None:
+        return
+    page.cancel()
+    if page.done() and not page.cancelled():
+        page.exception()
+
+
+async def paginate(
+    fetch: PageFetcher,
+    query: None | dict | QueryBuilder = None,
+    *,
+    page_size: Optional[int] = None,
+    stop: Optional[Callable[[Any], bool]] = None,
+    limit: Optional[int] = None,
+    concurrency: int = 1,
+    buffer_pages: Optional[int] = None,
+    probe: bool = False,
+    keyset: Optional[Sequence[str]] = None,
+    compare_type: Optional[int] = None,
+    sizer: Optional["PageSizer"] = None,
+    endpoint: Optional[str] = None,
+) -> AsyncIterator[Any]:
+    """
+    Walk every page of a list endpoint and yield its items one by one.
+
+    The next page is requested while the items of the current one are being
+    consumed, so downstream work overlaps with the network. Iteration ends
+    once the reported total is reached or on an empty page (on a short page
+    when the listing reports no total), after ``limit`` items, or at the
+    first item for which ``stop(item)`` is true (that item is not yielded).
+
+    With ``concurrency`` above 1 the total reported by the first page (or by a
+    ``Count=1`` probe when ``probe`` is set) is split into offset windows that
+    are fetched ``concurrency`` at a time; items still come out in order.
+    The windows are planned once, so rows inserted meanwhile may be missed.
+
+    With ``keyset`` the listing is ordered by those property paths instead and
+    every page continues from the last item of the previous one through a
+    ``FilterQuery`` with ``compare_type`` (the platform's "greater than or
+    equal" code) rather than a growing ``Offset``. The paths must end in a
+    unique key, e.g. ``("CreatedAt", "Id")``, and the query must not carry its
+    own ordering.
+
+    Without an explicit ``page_size``, a ``sizer`` picks the size learned for
+    ``endpoint`` and keeps adjusting it from page to page, towards its target
+    latency and body size. Concurrent walks plan their windows with the size
+    known at the start and only report back to the sizer.
+
+    :param fetch: Sends one page request, e.g. ``lambda q: branch.Leads.GetList(q)``
+    :param query: Filters and ordering to page through; its offset is the starting point
+    :param page_size: Items per request (``Count``); learned by ``sizer`` or 100 when omitted
+    :param concurrency: Page requests in flight at once
+    :param buffer_pages: Pages held for in-order delivery; defaults to twice ``concurrency``
+    :param keyset: Property paths to seek on, most significant first
+    :param compare_type: ``CompareType`` used for the keyset filter
+    :param sizer: Page sizes learned per endpoint, usually the client's ``page_sizer``
+    :param endpoint: Endpoint the sizer keys its page size on
+    """
+    if isinstance(query, dict):
+        raise PaginationError("Pagination needs a QueryBuilder, not a prebuilt dict")
+    if sizer is not None and endpoint is None:
+        raise ValueError("Page size tuning needs the endpoint to tune for")
+    if page_size is not None and page_size < 1:
+        raise ValueError("page_size must be at least 1")
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+
+    if keyset is not None:
+        if not keyset or compare_type is None:
+            raise ValueError("keyset pagination needs at least one key and a compare_type")
+        if concurrency > 1:
+            raise ValueError("keyset pagination cannot fetch pages concurrently")
+        if query is not None and query.orders:
+            raise PaginationError("keyset pagination orders by its keys; drop the query's own ordering")
+
+    resize: Optional[Resize] = None
+    capped: Optional[Capped] = None
+    if sizer is not None:
+        capped = functools.partial(sizer.capped, endpoint)
+        fetch = measured(fetch, sizer, endpoint)
+        if page_size is None:
+            def resize() -> int:
+                size = sizer.size_for(endpoint)
+                return size if limit is None else max(1, min(size, limit))
+
+    if page_size is None:
+        page_size = resize() if resize is not None else DEFAULT_PAGE_SIZE
+    if limit is not None:
+        page_size = max(1, min(page_size, limit))
+
+    query = query.copy() if query is not None else QueryBuilder()
+    query.set_count(page_size)
+
+    if keyset is not None:
+        pages = _keyset_pages(fetch, query, keyset, compare_type, limit, resize, capped)
+    elif concurrency > 1:
+        pages = _parallel_pages(fetch, query, limit, concurrency,
+                                max(buffer_pages or 2 * concurrency, concurrency), probe, capped)
+    else:
+        pages = _sequential_pages(fetch, query, limit, resize, capped)
+
+    yielded = 0
+    try:
+        async for items in pages:
+            for item in items:
+                if stop is not None and stop(item):
+                    return
+                yield item
+                yielded += 1
+                if limit is not None and yielded >= limit:
+                    return
+    finally:
+        await pages.aclose()
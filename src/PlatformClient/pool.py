@@ -0,0 +1,175 @@
+import http.client
+import select
+import ssl
+import threading
+import time
+from collections import deque
+from typing import Callable, Optional
+
+
+class _ResumableHTTPSConnection(http.client.HTTPSConnection):
+    """HTTPSConnection that offers a previously negotiated TLS session on connect."""
+
+    def __init__(self, host: str, *, timeout: Optional[float], context: ssl.SSLContext,
+                 session: Optional[ssl.SSLSession] = None,
+                 on_handshake: Optional[Callable[[bool], None]] = None):
+        super().__init__(host, timeout=timeout, context=context)
+        self.tls_session = session
+        self.on_handshake = on_handshake
+
+    def connect(self):
+        http.client.HTTPConnection.connect(self)
+        server_hostname = self._tunnel_host or self.host
+        self.sock = self._context.wrap_socket(
+            self.sock,
+            server_hostname=server_hostname,
+            session=self.tls_session,
+        )
+        if self.on_handshake is not None:
+            self.on_handshake(self.sock.session_reused)
+
+
+class ConnectionPool:
+    """
+    Thread-safe pool of keep-alive HTTPS connections, keyed by host.
+
+    Idle connections are kept up to ``max_size`` per host and dropped once they
+    have been unused for longer than ``idle_timeout`` seconds. Every checkout
+    runs a cheap health check, so a socket the server has already closed is
+    replaced with a fresh one instead of failing the request.
+
+    All connections share one ``ssl.SSLContext``, and new sockets offer the last
+    TLS session seen for their host so the server can resume it instead of
+    doing a full handshake.
+    """
+
+    def __init__(self, max_size: int = 10, idle_timeout: float = 60.0,
+                 ssl_context: Optional[ssl.SSLContext] = None):
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self.ssl_context = ssl_context or ssl.create_default_context()
+
+        self._idle: dict[str, deque[tuple[http.client.HTTPSConnection, float]]] = {}
+        self._sessions: dict[str, ssl.SSLSession] = {}
+        self._lock = threading.Lock()
+
+        self.created = 0
+        self.reused = 0
+        self.discarded = 0
+        self.tls_handshakes = 0
+        self.tls_resumed = 0
+
+    def _new_connection(self, host: str, timeout: Optional[float]) -> http.client.HTTPSConnection:
+        with self._lock:
+            self.created += 1
+            session = self._sessions.get(host)
+        return _ResumableHTTPSConnection(
+            host,
+            timeout=timeout,
+            context=self.ssl_context,
+            session=session,
+            on_handshake=self._on_handshake,
+        )
+
+    def _on_handshake(self, resumed: bool):
+        with self._lock:
+            self.tls_handshakes += 1
+            if resumed:
+                self.tls_resumed += 1
+
+    def _remember_session(self, host: str, conn: http.client.HTTPSConnection):
+        # TLS 1.3 tickets arrive after the handshake, so the session is only
+        # worth storing once a response has been read from the socket.
+        session = getattr(conn.sock, "session", None)
+        if session is not None:
+            with self._lock:
+                self._sessions[host] = session
+
+    @staticmethod
+    def _is_alive(conn: http.client.HTTPSConnection) -> bool:
+        sock = conn.sock
+        if sock is None:
+            return False
+        try:
+            # An idle keep-alive socket must not be readable: readability means
+            # the peer sent EOF (or garbage) and the connection is unusable.
+            readable, _, _ = select.select([sock], [], [], 0)
+        except (OSError, ValueError):
+            return False
+        return not readable
+
+    def get(self, host: str, timeout: Optional[float] = None) -> tuple[http.client.HTTPSConnection, bool]:
+        """
+        Check out a connection for ``host``.
+
+        :return: ``(connection, reused)`` — ``reused`` is True when the connection
+            was taken from the pool rather than freshly created.
+        """
+        now = time.monotonic()
+        while True:
+            with self._lock:
+                idle = self._idle.get(host)
+                if not idle:
+                    break
+                conn, released_at = idle.pop()
+
+            if now - released_at > self.idle_timeout or not self._is_alive(conn):
+                self.discard(conn)
+                continue
+
+            conn.timeout = timeout
+            conn.sock.settimeout(timeout)
+            with self._lock:
+                self.reused += 1
+            return conn, True
+
+        return self._new_connection(host, timeout), False
+
+    def put(self, host: str, conn: http.client.HTTPSConnection):
+        """Return a connection whose response has been fully read."""
+        if conn.sock is None:
+            return
+
+        self._remember_session(host, conn)
+
+        now = time.monotonic()
+        expired = []
+        with self._lock:
+            idle = self._idle.setdefault(host, deque())
+            while idle and now - idle[0][1] > self.idle_timeout:
+                expired.append(idle.popleft()[0])
+            if len(idle) < self.max_size:
+                idle.append((conn, now))
+                conn = None
+
+        for stale in expired:
+            self.discard(stale)
+        if conn is not None:
+            self.discard(conn)
+
+    def discard(self, conn: http.client.HTTPSConnection):
+        with self._lock:
+            self.discarded += 1
+        conn.close()
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "idle": sum(len(idle) for idle in self._idle.values()),
+                "created": self.created,
+                "reused": self.reused,
+                "discarded": self.discarded,
+                "tls_handshakes": self.tls_handshakes,
+                "tls_resumed": self.tls_resumed,
+            }
+
+    def close(self):
+        with self._lock:
+            idle, self._idle = self._idle, {}
+
+        for connections in idle.values():
+            for conn, _ in connections:
+                conn.close()
@@ -40,6 +40,14 @@ class QueryBuilder:
         self.filters = []
         self.orders = []
 
+    def copy(self) -> "QueryBuilder":
+        clone = QueryBuilder()
+        clone.offset = self.offset
+        clone.count = self.count
+        clone.filters = [dict(item) for item in self.filters]
+        clone.orders = [dict(item) for item in self.orders]
+        return clone
+
     def set_offset(self, offset: int):
         self.offset = offset
         return self
@@ -0,0 +1,122 @@
+import asyncio
+import time
+from typing import Optional
+
+from .utils import match_prefix
+
+
+class TokenBucket:
+    """
+    Async token bucket refilled at ``rate`` tokens per second, holding at most ``burst``.
+
+    Callers reserve their token up front, so the balance may go negative and
+    each waiter sleeps exactly until its own token is due. Waiters are served in
+    arrival order and no thread is ever blocked.
+    """
+
+    def __init__(self, rate: float, burst: Optional[float] = None):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1.0, rate)
+        if self.burst < 1:
+            raise ValueError("burst must be at least 1")
+
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+
+        self.acquired = 0
+        self.throttled = 0
+        self.wait_time = 0.0
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def reserve(self) -> float:
+        """Take one token and return how long to wait before it may be used."""
+        self._refill()
+        self._tokens -= 1
+        self.acquired += 1
+        if self._tokens >= 0:
+            return 0.0
+        delay = -self._tokens / self.rate
+        self.throttled += 1
+        self.wait_time += delay
+        return delay
+
+    def cancel(self):
+        """Give back a token whose caller gave up waiting."""
+        self._tokens += 1
+        self.acquired -= 1
+
+    def stats(self) -> dict:
+        self._refill()
+        return {
+            "rate": self.rate,
+            "burst": self.burst,
+            "tokens": round(self._tokens, 3),
+            "acquired": self.acquired,
+            "throttled": self.throttled,
+            "wait_time": round(self.wait_time, 3),
+        }
+
+
+class RateLimiter:
+    """
+    Client-wide request pacing with an optional global bucket and per-prefix buckets.
+
+    A call takes a token from the global bucket and from the bucket of the
+    longest matching endpoint prefix, so ``/CompanyBranchBoard`` can be held
+    below the overall rate.
+
+    :param rate: Global requests per second, or None for no global limit
+    :param burst: Global bucket size; defaults to one second worth of requests
+    :param endpoints: Per-prefix limits, either ``rate`` or ``(rate, burst)``,
+        e.g. ``{"/CompanyBranchBoard": 5}``
+    """
+
+    def __init__(
+        self,
+        rate: Optional[float] = None,
+        burst: Optional[float] = None,
+        endpoints: Optional[dict[str, float | tuple[float, float]]] = None,
+    ):
+        self.bucket: Optional[TokenBucket] = TokenBucket(rate, burst) if rate is not None else None
+        self.endpoints: dict[str, TokenBucket] = {}
+        for prefix, limit in (endpoints or {}).items():
+            if isinstance(limit, tuple):
+                self.endpoints[prefix] = TokenBucket(*limit)
+            else:
+                self.endpoints[prefix] = TokenBucket(limit)
+
+    def buckets_for(self, endpoint: str) -> list[TokenBucket]:
+        buckets = [self.bucket] if self.bucket is not None else []
+        prefix = match_prefix(endpoint, self.endpoints)
+        if prefix is not None:
+            buckets.append(self.endpoints[prefix])
+        return buckets
+
+    async def acquire(self, endpoint: str):
+        """Wait until ``endpoint`` may be called."""
+        buckets = self.buckets_for(endpoint)
+        if not buckets:
+            return
+
+        delay = max(bucket.reserve() for bucket in buckets)
+        if delay <= 0:
+            return
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            for bucket in buckets:
+                bucket.cancel()
+            raise
+
+    def stats(self) -> dict:
+        return {
+            "global": self.bucket.stats() if self.bucket is not None else None,
+            "endpoints": {prefix: bucket.stats() for prefix, bucket in self.endpoints.items()},
+        }
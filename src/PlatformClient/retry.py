@@ -0,0 +1,139 @@
+import asyncio
+import http.client
+import random
+import time
+from email.utils import parsedate_to_datetime
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    from .utils import PlatformResponse
+
+
+RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+RETRYABLE_EXCEPTIONS: tuple[type[BaseException], ...] = (
+    ConnectionError,
+    TimeoutError,
+    asyncio.TimeoutError,
+    asyncio.IncompleteReadError,
+    http.client.HTTPException,
+)
+
+
+def is_idempotent(endpoint: str) -> bool:
+    """
+    Whether repeating a call to ``endpoint`` is safe.
+
+    Platform reads are all named ``Get*`` (``Get``, ``GetDetails``,
+    ``GetVariables``, ``GetAccess``...); every other endpoint may change state.
+    """
+    return endpoint.rstrip("/").rsplit("/", 1)[-1].startswith("Get")
+
+
+class RetryPolicy:
+    """
+    When and how often a failed call is repeated.
+
+    Reads are retried on any status in ``retry_statuses`` and on transport
+    errors in ``retry_exceptions``. Mutating calls are only retried on
+    ``mutation_statuses`` (by default just 429, which the platform answers
+    before doing any work), because a lost response says nothing about whether
+    the write happened. Delays use exponential backoff with full jitter, unless
+    the server sent a ``Retry-After`` header.
+
+    :param max_attempts: Total attempts including the first one; 1 disables retries
+    :param backoff_base: Delay cap for the first retry, in seconds
+    :param backoff_max: Upper bound for any backoff delay
+    :param retry_after_max: Longest ``Retry-After`` that is waited out; longer
+        ones return the response as is
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        backoff_base: float = 0.25,
+        backoff_max: float = 10.0,
+        retry_statuses: frozenset[int] = RETRYABLE_STATUSES,
+        mutation_statuses: frozenset[int] = frozenset({429}),
+        retry_exceptions: tuple[type[BaseException], ...] = RETRYABLE_EXCEPTIONS,
+        respect_retry_after: bool = True,
+        retry_after_max: float = 60.0,
+    ):
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.retry_statuses = retry_statuses
+        self.mutation_statuses = mutation_statuses
+        self.retry_exceptions = retry_exceptions
+        self.respect_retry_after = respect_retry_after
+        self.retry_after_max = retry_after_max
+
+        self.retries = 0
+        self.gave_up = 0
+        self.retried_statuses: dict[int, int] = {}
+        self.retried_exceptions: dict[str, int] = {}
+
+    def backoff(self, attempt: int) -> float:
+        """Full-jitter delay before retry number ``attempt`` (starting at 1)."""
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** (attempt - 1)))
+
+    @staticmethod
+    def retry_after(response: "PlatformResponse") -> Optional[float]:
+        value = response.headers.get("Retry-After")
+        if not value:
+            return None
+        value = value.strip()
+        if value.isdigit():
+            return float(value)
+        try:
+            return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+        except (TypeError, ValueError):
+            return None
+
+    def response_delay(self, endpoint: str, response: "PlatformResponse", attempt: int) -> Optional[float]:
+        """Delay before repeating a call that returned ``response``, or None to keep it."""
+        statuses = self.retry_statuses if is_idempotent(endpoint) else self.mutation_statuses
+        if response.status not in statuses:
+            return None
+
+        if attempt >= self.max_attempts:
+            self.gave_up += 1
+            return None
+
+        delay = self.backoff(attempt)
+        if self.respect_retry_after:
+            retry_after = self.retry_after(response)
+            if retry_after is not None:
+                if retry_after > self.retry_after_max:
+                    self.gave_up += 1
+                    return None
+                delay = retry_after
+
+        self.retries += 1
+        self.retried_statuses[response.status] = self.retried_statuses.get(response.status, 0) + 1
+        return delay
+
+    def exception_delay(self, endpoint: str, error: BaseException, attempt: int) -> Optional[float]:
+        """Delay before repeating a call that raised ``error``, or None to re-raise it."""
+        if not is_idempotent(endpoint) or not isinstance(error, self.retry_exceptions):
+            return None
+
+        if attempt >= self.max_attempts:
+            self.gave_up += 1
+            return None
+
+        name = type(error).__name__
+        self.retries += 1
+        self.retried_exceptions[name] = self.retried_exceptions.get(name, 0) + 1
+        return self.backoff(attempt)
+
+    def stats(self) -> dict:
+        return {
+            "retries": self.retries,
+            "gave_up": self.gave_up,
+            "statuses": dict(self.retried_statuses),
+            "exceptions": dict(self.retried_exceptions),
+        }
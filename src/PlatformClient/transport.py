@@ -0,0 +1,291 @@
+import asyncio
+import ssl
+import time
+from collections import deque
+from typing import TYPE_CHECKING, Optional
+from urllib.parse import urlsplit
+
+from .retry import is_idempotent
+from .utils import READ_CHUNK_SIZE, PlatformResponse, prepare_request
+
+if TYPE_CHECKING:
+    from .client import PlatformClient
+
+
+_MAX_LINE = 65536
+_MAX_HEADERS = 100
+
+
+class AsyncConnection:
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.reader = reader
+        self.writer = writer
+        self.loop = asyncio.get_running_loop()
+        self.released_at = time.monotonic()
+
+    def is_alive(self) -> bool:
+        return (
+            self.loop is asyncio.get_running_loop()
+            and not self.writer.is_closing()
+            and not self.reader.at_eof()
+            # an idle keep-alive connection must have nothing buffered
+            and not self.reader._buffer  # noqa
+        )
+
+    def close(self):
+        try:
+            self.writer.close()
+        except RuntimeError:
+            # the loop the connection was opened on is already closed
+            pass
+
+
+class AsyncConnectionPool:
+    """
+    asyncio counterpart of :class:`~PlatformClient.pool.ConnectionPool`.
+
+    Connections are plain ``asyncio`` streams, so concurrency is bounded by
+    sockets rather than by executor threads. It is only ever touched from the
+    event loop and therefore needs no locking.
+    """
+
+    def __init__(self, max_size: int = 10, idle_timeout: float = 60.0,
+                 ssl_context: Optional[ssl.SSLContext] = None):
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        # asyncio streams cannot offer a TLS session on connect, so only the
+        # context (certificates, ciphers) is shared here
+        self.ssl_context = ssl_context or ssl.create_default_context()
+
+        self._idle: dict[str, deque[AsyncConnection]] = {}
+
+        self.created = 0
+        self.reused = 0
+        self.discarded = 0
+
+    async def get(self, host: str) -> tuple[AsyncConnection, bool]:
+        now = time.monotonic()
+        idle = self._idle.get(host)
+        while idle:
+            conn = idle.pop()
+            if now - conn.released_at > self.idle_timeout or not conn.is_alive():
+                self.discard(conn)
+                continue
+            self.reused += 1
+            return conn, True
+
+        address = urlsplit(f"//{host}")
+        reader, writer = await asyncio.open_connection(
+            address.hostname,
+            address.port or 443,
+            ssl=self.ssl_context,
+            server_hostname=address.hostname,
+        )
+        self.created += 1
+        return AsyncConnection(reader, writer), False
+
+    def put(self, host: str, conn: AsyncConnection):
+        idle = self._idle.setdefault(host, deque())
+        now = time.monotonic()
+        while idle and now - idle[0].released_at > self.idle_timeout:
+            self.discard(idle.popleft())
+
+        if len(idle) >= self.max_size:
+            self.discard(conn)
+            return
+
+        conn.released_at = now
+        idle.append(conn)
+
+    def discard(self, conn: AsyncConnection):
+        self.discarded += 1
+        conn.close()
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "idle": sum(len(idle) for idle in self._idle.values()),
+            "created": self.created,
+            "reused": self.reused,
+            "discarded": self.discarded,
+        }
+
+    def close(self):
+        idle, self._idle = self._idle, {}
+        for connections in idle.values():
+            for conn in connections:
+                conn.close()
+
+
+async def _read_line(reader: asyncio.StreamReader) -> bytes:
+    line = await reader.readline()
+    if len(line) > _MAX_LINE:
+        raise ValueError("HTTP header line is too long")
+    return line
+
+
+class _AsyncBody:
+    """HTTPResponse-like view of a response whose body is still on the wire."""
+
+    def __init__(self, reader: asyncio.StreamReader, status: int, reason: str,
+                 headers: list[tuple[str, str]], method: str, timeout: Optional[float]):
+        self.status = status
+        self.reason = reason
+        self._headers = headers
+        self._reader = reader
+        self._timeout = timeout
+
+        fields = {name.lower(): value for name, value in headers}
+        self._chunked = False
+        self._remaining: Optional[int] = None
+        self._chunk_left = 0
+        self.complete = False
+
+        if method == "HEAD" or status in (204, 304) or 100 <= status < 200:
+            self._remaining = 0
+        elif "chunked" in fields.get("transfer-encoding", "").lower():
+            self._chunked = True
+        elif "content-length" in fields:
+            self._remaining = int(fields["content-length"])
+
+        self.until_eof = not self._chunked and self._remaining is None
+        if self._remaining == 0:
+            self.complete = True
+
+    def getheaders(self) -> list[tuple[str, str]]:
+        return self._headers
+
+    async def aread(self, amt: int = READ_CHUNK_SIZE) -> bytes:
+        if self.complete:
+            return b""
+        return await asyncio.wait_for(self._read(amt), self._timeout)
+
+    async def _read(self, amt: int) -> bytes:
+        reader = self._reader
+
+        if self._chunked:
+            if self._chunk_left == 0:
+                size_line = await _read_line(reader)
+                if not size_line:
+                    raise asyncio.IncompleteReadError(b"", None)
+                self._chunk_left = int(size_line.split(b";", 1)[0].strip(), 16)
+                if self._chunk_left == 0:
+                    # trailers
+                    while (await _read_line(reader)) not in (b"\r\n", b"\n", b""):
+                        pass
+                    self.complete = True
+                    return b""
+
+            data = await reader.readexactly(min(amt, self._chunk_left))
+            self._chunk_left -= len(data)
+            if self._chunk_left == 0:
+                await reader.readexactly(2)
+            return data
+
+        if self._remaining is not None:
+            data = await reader.readexactly(min(amt, self._remaining))
+            self._remaining -= len(data)
+            if self._remaining == 0:
+                self.complete = True
+            return data
+
+        data = await reader.read(amt)
+        if not data:
+            self.complete = True
+        return data
+
+
+async def _read_response(conn: AsyncConnection, method: str, timeout: Optional[float]) -> tuple[_AsyncBody, bool]:
+    reader = conn.reader
+    while True:
+        status_line = await _read_line(reader)
+        if not status_line:
+            raise ConnectionResetError("Remote end closed connection without response")
+
+        version, status, reason = (status_line.decode("iso-8859-1").rstrip("\r\n").split(" ", 2) + [""])[:3]
+        if not version.startswith("HTTP/"):
+            raise ValueError(f"Malformed HTTP status line: {status_line[:100]!r}")
+        status = int(status)
+
+        headers = []
+        while True:
+            line = await _read_line(reader)
+            if line in (b"\r\n", b"\n", b""):
+                break
+            if len(headers) >= _MAX_HEADERS:
+                raise ValueError("Too many HTTP headers in response")
+            name, _, value = line.decode("iso-8859-1").partition(":")
+            headers.append((name.strip(), value.strip()))
+
+        if status != 100:
+            break
+
+    connection = next((value for name, value in headers if name.lower() == "connection"), "").lower()
+    will_close = connection == "close" or (version == "HTTP/1.0" and connection != "keep-alive")
+
+    body = _AsyncBody(reader, status, reason, headers, method, timeout)
+    return body, will_close or body.until_eof
+
+
+async def async_request(
+    client: "PlatformClient",
+    endpoint: str,
+    body: dict | str | None = None,
+    *,
+    method: str = "POST",
+    timeout: Optional[float] = 30.0,
+    stream: bool = False,
+    headers: Optional[dict[str, str]] = None,
+) -> PlatformResponse:
+    """Native asyncio HTTP/1.1 counterpart of :func:`~PlatformClient.utils.sync_request`."""
+    headers, body_data = prepare_request(client, body, headers)
+    method = method.upper()
+
+    if getattr(client, "debug_logs", False):
+        print(f"[⌛] {client.host}{endpoint} : {headers} : {body_data.decode('utf-8', 'replace')}")
+
+    head = [f"{method} {endpoint} HTTP/1.1", f"Host: {client.host}", f"Content-Length: {len(body_data)}"]
+    head += [f"{name}: {value}" for name, value in headers.items()]
+    request = ("\r\n".join(head) + "\r\n\r\n").encode("utf-8") + body_data
+
+    pool = client.async_pool
+
+    def release(response: PlatformResponse, reusable: bool):
+        if reusable and not will_close:
+            pool.put(client.host, conn)
+        else:
+            pool.discard(conn)
+        client.record_response(response)
+
+    while True:
+        conn, reused = await asyncio.wait_for(pool.get(client.host), timeout)
+        sent = False
+        try:
+            conn.writer.write(request)
+            await asyncio.wait_for(conn.writer.drain(), timeout)
+            sent = True
+            resp, will_close = await asyncio.wait_for(_read_response(conn, method, timeout), timeout)
+        except (ConnectionResetError, ConnectionAbortedError, BrokenPipeError):
+            pool.discard(conn)
+            if reused and (not sent or is_idempotent(endpoint)):
+                # the server dropped an idle keep-alive socket; retry on a new one, unless
+                # it may have received a write already
+                continue
+            raise
+        except BaseException:
+            pool.discard(conn)
+            raise
+
+        # always streamed underneath, so max_body_size is checked per chunk in buffered mode too
+        response = PlatformResponse(
+            resp,
+            stream=True,
+            max_body_size=client.max_body_size,
+            release=release,
+            codec=client.json_codec,
+        )
+        if not stream:
+            await response.aread()
+        return response
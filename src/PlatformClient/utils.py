@@ -1,67 +1,480 @@
+import asyncio
 import http.client
 import json
 import re
-from typing import TYPE_CHECKING, Optional
+import zlib
+from collections.abc import Mapping
+from concurrent.futures import Executor
+from typing import TYPE_CHECKING, Any, AsyncIterator, Callable, Iterable, Iterator, Optional
+
+from .codec import JSONCodec, get_codec
+from .exceptions import ResponseTooLargeError
+from .json_stream import ItemScanner
+from .retry import is_idempotent
 
 if TYPE_CHECKING:
     from .client import PlatformClient
 
 
+READ_CHUNK_SIZE = 64 * 1024
+
+_CHARSET_RE = re.compile(r"charset=([^\s;]+)", re.I)
+
+
+class ContentDecoder:
+    """Incremental decoder for a ``gzip`` or ``deflate`` encoded body."""
+
+    def __init__(self, encoding: str):
+        self.encoding = encoding
+        if encoding == "gzip":
+            self._obj = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        else:
+            self._obj = zlib.decompressobj()
+        self._started = False
+
+    @classmethod
+    def for_encoding(cls, content_encoding: str | None) -> Optional["ContentDecoder"]:
+        encoding = (content_encoding or "").strip().lower()
+        if encoding in ("gzip", "x-gzip"):
+            return cls("gzip")
+        if encoding == "deflate":
+            return cls("deflate")
+        return None
+
+    @property
+    def pending(self) -> bool:
+        """Whether input is buffered whose output was held back by ``max_length``."""
+        return bool(self._obj.unconsumed_tail)
+
+    def decompress(self, data: bytes, max_length: int = 0) -> bytes:
+        """
+        Decode the next piece of the body.
+
+        With ``max_length`` at most that many bytes are returned; the rest stays
+        buffered (see :attr:`pending`) so a highly compressed chunk never
+        inflates into one huge block.
+        """
+        data = self._obj.unconsumed_tail + data
+        try:
+            if not self._started and self.encoding == "deflate":
+                self._started = True
+                try:
+                    return self._obj.decompress(data, max_length)
+                except zlib.error:
+                    # some servers send raw deflate without the zlib header
+                    self._obj = zlib.decompressobj(-zlib.MAX_WBITS)
+            self._started = True
+            return self._obj.decompress(data, max_length)
+        except zlib.error as e:
+            raise ValueError(f"Failed to decode {self.encoding} response body") from e
+
+    def flush(self) -> bytes:
+        return self._obj.flush()
+
+
+class Headers(Mapping):
+    """Read-only, case-insensitive view of response headers (the last value of a repeated header wins)."""
+
+    __slots__ = ("_fields",)
+
+    def __init__(self, items: list[tuple[str, str]]):
+        self._fields: dict[str, tuple[str, str]] = {name.lower(): (name, value) for name, value in items}
+
+    def __getitem__(self, name: str) -> str:
+        return self._fields[name.lower()][1]
+
+    def __contains__(self, name: object) -> bool:
+        return isinstance(name, str) and name.lower() in self._fields
+
+    def __iter__(self) -> Iterator[str]:
+        return (name for name, _ in self._fields.values())
+
+    def __len__(self) -> int:
+        return len(self._fields)
+
+    def __repr__(self) -> str:
+        return f"Headers({dict(self.items())!r})"
+
+
+def _find_header(items: list[tuple[str, str]], name: str) -> Optional[str]:
+    value = None
+    for key, item_value in items:
+        if key.lower() == name:
+            value = item_value
+    return value
+
+
+_UNSET = object()
+
+
 class PlatformResponse:
-    def __init__(self, resp: http.client.HTTPResponse):
-        self._raw: bytes = resp.read()
+    """
+    Response of a platform call.
+
+    By default the whole body is read (and decompressed) up front. With
+    ``stream=True`` only the status line and headers are available right away;
+    the body is pulled on demand through :meth:`iter_bytes` / :meth:`aiter_bytes`
+    (or loaded by :meth:`bytes` / :meth:`aread`), and :meth:`close` drops it
+    unread. The underlying connection is handed back through ``release`` once
+    the body is exhausted or the response is closed.
+    """
+
+    __slots__ = (
+        "status", "reason", "ok", "wire_bytes", "body_bytes",
+        "_header_items", "_headers", "_charset", "_json",
+        "_resp", "_decoder", "_max_body_size", "_release", "_executor", "_codec",
+        "_raw", "_consumed", "_exhausted", "_closed",
+    )
+
+    def __init__(
+        self,
+        resp: http.client.HTTPResponse,
+        *,
+        stream: bool = False,
+        max_body_size: Optional[int] = None,
+        release: Optional[Callable[["PlatformResponse", bool], None]] = None,
+        executor: Optional[Executor] = None,
+        codec: Optional[JSONCodec] = None,
+    ):
         self.status: int = resp.status
         self.reason: str = resp.reason
-        self.headers: dict[str, str] = {k: v for k, v in resp.getheaders()}
         self.ok: bool = 200 <= resp.status < 300
 
+        self._header_items: list[tuple[str, str]] = resp.getheaders()
+        self._headers: Optional[Headers] = None
+        self._charset: Optional[str] = None
+        self._json: Any = _UNSET
+
+        content_encoding = _find_header(self._header_items, "content-encoding")
+
+        self._resp = resp
+        self._decoder = ContentDecoder.for_encoding(content_encoding)
+        self._max_body_size = max_body_size
+        self._release = release
+        self._executor = executor
+        self._codec = codec or get_codec()
+        self._raw: Optional[bytes] = None
+        self._consumed = False
+        self._exhausted = False
+        self._closed = False
+
+        self.wire_bytes: int = 0
+        self.body_bytes: int = 0
+
+        if not stream:
+            try:
+                self._raw = b"".join(iter(lambda: self._read_chunk(READ_CHUNK_SIZE), b""))
+            except BaseException:
+                self.close()
+                raise
+
+    def _needs_input(self) -> bool:
+        return self._decoder is None or not self._decoder.pending
+
+    def _feed(self, data: bytes, amt: int) -> bytes:
+        if data:
+            self.wire_bytes += len(data)
+            chunk = self._decoder.decompress(data, amt) if self._decoder else data
+        elif not self._needs_input():
+            chunk = self._decoder.decompress(b"", amt)
+        else:
+            chunk = self._decoder.flush() if self._decoder else b""
+            self._exhausted = True
+
+        self.body_bytes += len(chunk)
+        if self._max_body_size is not None and self.body_bytes > self._max_body_size:
+            self.close()
+            raise ResponseTooLargeError(self._max_body_size)
+
+        if self._exhausted:
+            self._finish(reusable=True)
+        return chunk
+
+    def _read_chunk(self, amt: int) -> bytes:
+        read = getattr(self._resp, "read", None)
+        if read is None:
+            raise RuntimeError("This response streams over asyncio; use aiter_bytes() or 'await aread()'")
+
+        while not self._exhausted and not self._closed:
+            chunk = self._feed(read(amt) if self._needs_input() else b"", amt)
+            if chunk:
+                return chunk
+        return b""
+
+    async def _aread_chunk(self, amt: int) -> bytes:
+        aread = getattr(self._resp, "aread", None)
+        while not self._exhausted and not self._closed:
+            if not self._needs_input():
+                data = b""
+            elif aread is not None:
+                data = await aread(amt)
+            else:
+                loop = asyncio.get_running_loop()
+                data = await loop.run_in_executor(self._executor, self._resp.read, amt)
+            chunk = self._feed(data, amt)
+            if chunk:
+                return chunk
+        return b""
+
+    def _finish(self, reusable: bool):
+        if self._release is not None:
+            release, self._release = self._release, None
+            release(self, reusable)
+
+    def _start_consuming(self):
+        if self._consumed:
+            raise RuntimeError("Response body has already been consumed")
+        if self._closed:
+            raise RuntimeError("Response has been closed before its body was read")
+        self._consumed = True
+
+    def iter_bytes(self, chunk_size: int = READ_CHUNK_SIZE) -> Iterator[bytes]:
+        """Yield the decoded body in chunks of roughly ``chunk_size`` bytes."""
+        if self._raw is not None:
+            for i in range(0, len(self._raw), chunk_size):
+                yield self._raw[i:i + chunk_size]
+            return
+
+        self._start_consuming()
+        try:
+            while chunk := self._read_chunk(chunk_size):
+                yield chunk
+        finally:
+            self.close()
+
+    async def aiter_bytes(self, chunk_size: int = READ_CHUNK_SIZE) -> AsyncIterator[bytes]:
+        """Async variant of :meth:`iter_bytes` that never blocks the event loop."""
+        if self._raw is not None:
+            for i in range(0, len(self._raw), chunk_size):
+                yield self._raw[i:i + chunk_size]
+            return
+
+        self._start_consuming()
+        try:
+            while chunk := await self._aread_chunk(chunk_size):
+                yield chunk
+        finally:
+            self.close()
+
+    def iter_items(self, path: str = "data.items", chunk_size: int = READ_CHUNK_SIZE) -> Iterator[Any]:
+        """
+        Yield the elements of the JSON array at ``path`` one by one while the body is read.
+
+        Combined with ``stream=True`` only one element is held in memory at a
+        time. ``path`` is a dotted list of object keys; use ``""`` when the body
+        itself is an array.
+        """
+        scanner = ItemScanner(path)
+        for chunk in self.iter_bytes(chunk_size):
+            # keep reading after the array ends so the connection can be reused
+            for item in scanner.feed(chunk):
+                yield self._codec.loads(item)
+        scanner.close()
+
+    async def aiter_items(self, path: str = "data.items", chunk_size: int = READ_CHUNK_SIZE) -> AsyncIterator[Any]:
+        """Async variant of :meth:`iter_items`."""
+        scanner = ItemScanner(path)
+        async for chunk in self.aiter_bytes(chunk_size):
+            # keep reading after the array ends so the connection can be reused
+            for item in scanner.feed(chunk):
+                yield self._codec.loads(item)
+        scanner.close()
+
+    async def aread(self) -> bytes:
+        """Load the rest of a streamed body without blocking the event loop."""
+        if self._raw is None:
+            self._raw = b"".join([chunk async for chunk in self.aiter_bytes()])
+        return self._raw
+
+    def close(self):
+        """Release the connection, dropping whatever part of the body is still unread."""
+        if self._closed:
+            return
+        self._closed = True
+        self._finish(reusable=self._exhausted)
+
+    def __enter__(self) -> "PlatformResponse":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    async def __aenter__(self) -> "PlatformResponse":
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.close()
+
+    @property
+    def headers(self) -> Headers:
+        if self._headers is None:
+            self._headers = Headers(self._header_items)
+        return self._headers
+
     def _encoding(self) -> str:
-        ct = self.headers.get("Content-Type", "")
-        m = re.search(r"charset=([^\s;]+)", ct, re.I)
-        return (m.group(1) if m else "utf-8").strip('"').strip()
+        if self._charset is None:
+            ct = _find_header(self._header_items, "content-type") or ""
+            m = _CHARSET_RE.search(ct)
+            self._charset = (m.group(1) if m else "utf-8").strip('"').strip()
+        return self._charset
 
     def text(self, errors: str = "strict") -> str:
-        return self._raw.decode(self._encoding(), errors=errors)
+        return self.bytes().decode(self._encoding(), errors=errors)
 
     def json(self) -> dict:
+        """
+        Parse the body as JSON.
+
+        The result is cached, so every call returns the same object; copy it
+        before mutating if other code holds the same response.
+        """
+        if self._json is not _UNSET:
+            return self._json
+
+        raw = self.bytes()
+        encoding = self._encoding().lower()
         try:
-            return json.loads(self.text())
-        except json.JSONDecodeError as e:
-            snippet = self._raw[:200].decode(self._encoding(), errors="replace")
+            if encoding in ("utf-8", "utf8", "ascii", "us-ascii"):
+                # decode straight from bytes, without building an intermediate str
+                self._json = self._codec.loads(raw)
+            else:
+                self._json = self._codec.loads(raw.decode(encoding))
+        except ValueError as e:
+            snippet = raw[:200].decode(encoding, errors="replace")
             raise ValueError(f"Response is not valid JSON (status {self.status}): {snippet}") from e
+        return self._json
 
     def bytes(self) -> bytes:
+        if self._raw is None:
+            self._raw = b"".join(self.iter_bytes())
         return self._raw
 
 
-def sync_request(
-    client: "PlatformClient",
-    endpoint: str,
-    body: dict | str | None = None,
-    *,
-    method: str = "POST",
-    timeout: Optional[float] = 30.0,
-) -> PlatformResponse:
+class BufferedResponse:
+    """Minimal stand-in for ``http.client.HTTPResponse`` over an already received body."""
+
+    def __init__(self, status: int, reason: str, headers: list[tuple[str, str]], body: bytes):
+        self.status = status
+        self.reason = reason
+        self._headers = headers
+        self._body = body
+        self._offset = 0
+
+    def getheaders(self) -> list[tuple[str, str]]:
+        return self._headers
+
+    def read(self, amt: Optional[int] = None) -> bytes:
+        start = self._offset
+        end = len(self._body) if amt is None else min(len(self._body), start + amt)
+        self._offset = end
+        if start == 0 and end == len(self._body):
+            return self._body
+        return self._body[start:end]
+
+
+def canonical_key(endpoint: str, body: dict | str | None) -> str:
+    """Key that is equal for two calls with the same endpoint and the same JSON body."""
+    if isinstance(body, str):
+        try:
+            body = json.loads(body)
+        except ValueError:
+            return f"{endpoint} {body}"
+    return f"{endpoint} {json.dumps(body, sort_keys=True, separators=(',', ':'), default=str)}"
+
+
+def match_prefix(endpoint: str, prefixes: Iterable[str]) -> Optional[str]:
+    """
+    Longest of ``prefixes`` that ``endpoint`` falls under, matching whole path segments.
+
+    ``/CompanyBranchBoard`` matches ``/CompanyBranchBoard/GetTasks`` but not
+    ``/CompanyBranchBoardSprint/Get``.
+    """
+    best = None
+    for prefix in prefixes:
+        base = prefix.rstrip("/")
+        if endpoint == base or endpoint.startswith(base + "/"):
+            if best is None or len(prefix) > len(best):
+                best = prefix
+    return best
+
+
+_STALE_CONNECTION_ERRORS = (
+    http.client.RemoteDisconnected,
+    http.client.BadStatusLine,
+    ConnectionResetError,
+    ConnectionAbortedError,
+    BrokenPipeError,
+)
+
+
+def prepare_request(client: "PlatformClient", body: dict | str | None,
+                    extra_headers: Optional[dict[str, str]] = None) -> tuple[dict[str, str], bytes]:
     headers = {
         "Content-Type": "application/json",
+        "Accept-Encoding": "gzip, deflate",
         "api_id": str(client.api_id),
         "api_access_token": client.api_access_token,
     }
+    if extra_headers:
+        headers.update(extra_headers)
 
     if isinstance(body, dict):
-        body_data = json.dumps(body)
+        body_data = client.json_codec.dumps(body)
     elif isinstance(body, str):
-        body_data = body
+        body_data = body.encode("utf-8")
     else:
-        body_data = "{}"
-
-    conn = http.client.HTTPSConnection(client.host, timeout=timeout)
-    try:
-        if getattr(client, "debug_logs", False):
-            print(f"[⌛] {client.host}{endpoint} : {headers} : {body_data}")
-
-        conn.request(method.upper(), endpoint, body=body_data, headers=headers)
-        resp = conn.getresponse()
-        return PlatformResponse(resp)
-    finally:
-        conn.close()
+        body_data = b"{}"
+
+    return headers, body_data
+
+
+def sync_request(
+    client: "PlatformClient",
+    endpoint: str,
+    body: dict | str | None = None,
+    *,
+    method: str = "POST",
+    timeout: Optional[float] = 30.0,
+    stream: bool = False,
+    headers: Optional[dict[str, str]] = None,
+) -> PlatformResponse:
+    headers, body_data = prepare_request(client, body, headers)
+
+    if getattr(client, "debug_logs", False):
+        print(f"[⌛] {client.host}{endpoint} : {headers} : {body_data.decode('utf-8', 'replace')}")
+
+    pool = client.pool
+
+    def release(response: PlatformResponse, reusable: bool):
+        if reusable and not resp.will_close:
+            pool.put(client.host, conn)
+        else:
+            pool.discard(conn)
+        client.record_response(response)
+
+    while True:
+        conn, reused = pool.get(client.host, timeout)
+        sent = False
+        try:
+            conn.request(method.upper(), endpoint, body=body_data, headers=headers)
+            sent = True
+            resp = conn.getresponse()
+        except _STALE_CONNECTION_ERRORS:
+            pool.discard(conn)
+            if reused and (not sent or is_idempotent(endpoint)):
+                # the server dropped an idle keep-alive socket; retry on a new one, unless
+                # it may have received a write already
+                continue
+            raise
+        except BaseException:
+            pool.discard(conn)
+            raise
+
+        return PlatformResponse(
+            resp,
+            stream=stream,
+            max_body_size=client.max_body_size,
+            release=release,
+            executor=client.executor,
+            codec=client.json_codec,
+        )
@@ -0,0 +1,82 @@
+import timeit
+import uuid
+
+from src.PlatformClient.codec import CODECS, get_codec
+
+# Shapes follow CompanyBranchBoard/GetTasks and CompanyBranchLead/GetLeadGroups responses
+TASKS_PAYLOAD = {
+    "data": {
+        "count": 500,
+        "items": [
+            {
+                "id": str(uuid.uuid4()),
+                "name": f"Task #{i}: call the lead back",
+                "description": "Клієнт просив передзвонити після 18:00 " * 3,
+                "stateId": str(uuid.uuid4()),
+                "sprintId": None,
+                "order": i,
+                "endTime": "2025-09-15T18:00:00.000Z",
+                "createdAt": "2025-08-20T13:05:44.664Z",
+                "managerUserId": str(uuid.uuid4()),
+                "tags": [{"id": str(uuid.uuid4()), "name": "urgent"}],
+                "students": [{"userId": str(uuid.uuid4()), "fullName": "Іван Петренко"}],
+                "subTasks": [{"id": str(uuid.uuid4()), "content": "step", "done": i % 2 == 0}],
+            }
+            for i in range(500)
+        ],
+    }
+}
+
+LEAD_GROUPS_PAYLOAD = {
+    "data": {
+        "count": 50,
+        "items": [
+            {
+                "id": str(uuid.uuid4()),
+                "name": f"Group {i}",
+                "courseId": str(uuid.uuid4()),
+                "lessonId": None,
+                "studentCount": 12,
+                "teacherList": [{"teacherUserId": str(uuid.uuid4())}],
+                "isActive": True,
+            }
+            for i in range(50)
+        ],
+    }
+}
+
+REQUEST_BODY = {
+    "companyBranchId": str(uuid.uuid4()),
+    "boardId": str(uuid.uuid4()),
+    "data": {"Offset": 0, "Count": 500, "FilterQuery": [], "OrderQuery": []},
+}
+
+NUMBER = 200
+
+
+def available_codecs():
+    for name in CODECS:
+        try:
+            yield get_codec(name)
+        except ImportError:
+            print(f"{name:<8} not installed")
+
+
+def main():
+    payloads = {
+        "GetTasks": get_codec("json").dumps(TASKS_PAYLOAD),
+        "GetLeadGroups": get_codec("json").dumps(LEAD_GROUPS_PAYLOAD),
+    }
+
+    for codec in available_codecs():
+        for name, raw in payloads.items():
+            decode = timeit.timeit(lambda: codec.loads(raw), number=NUMBER) / NUMBER
+            print(f"{codec.name:<8} decode {name:<14} {len(raw):>8} B  {decode * 1e6:9.1f} us")
+
+        encode = timeit.timeit(lambda: codec.dumps(REQUEST_BODY), number=NUMBER * 10) / (NUMBER * 10)
+        print(f"{codec.name:<8} encode request body           {encode * 1e6:9.1f} us")
+
+    print(f"auto-detected: {get_codec().name}")
+
+
+main()
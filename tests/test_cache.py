@@ -0,0 +1,249 @@
+import asyncio
+import json
+import time
+
+from src.PlatformClient import PlatformClient
+from src.PlatformClient.cache import CacheEntry, ResponseCache, bypass_cache
+from src.PlatformClient.disk_cache import DiskCache
+from src.PlatformClient.invalidation import InvalidationMap
+from src.PlatformClient.utils import BufferedResponse, PlatformResponse, canonical_key
+
+API_ID = "0198742f-14f1-7d6a-8579-3d0ee3f5c5d8"
+DETAILS = "/CompanyBranchRole/GetDetails"
+
+
+class Backend:
+    """Stands in for ``PlatformClient._attempt`` and answers from ``handler``."""
+
+    def __init__(self, handler=None):
+        self.handler = handler or (lambda endpoint, params, headers: (200, [], {"endpoint": endpoint}))
+        self.calls = []
+        self.responses = []
+
+    async def __call__(self, endpoint, path, params, stream, headers=None):
+        self.calls.append((endpoint, params, dict(headers or {})))
+        status, response_headers, payload = self.handler(endpoint, params, headers or {})
+        body = json.dumps(payload).encode() if payload is not None else b""
+        response = PlatformResponse(BufferedResponse(status, "", response_headers, body), stream=stream)
+        self.responses.append(response)
+        return response
+
+
+def client_with(cache: ResponseCache, backend: Backend) -> PlatformClient:
+    client = PlatformClient("https://platform.invalid", API_ID, "token", cache=cache)
+    client._attempt = backend
+    return client
+
+
+def details(branch="b1", role="r1"):
+    return {"companyBranchId": branch, "roleId": role}
+
+
+def test_hit_serves_a_fresh_copy_without_a_call():
+    backend = Backend()
+    client = client_with(ResponseCache(ttls={DETAILS: 60}), backend)
+
+    async def run():
+        first = await client.send_request(DETAILS, details())
+        second = await client.send_request(DETAILS, details())
+        assert first is not second
+        assert first.json() == second.json() == {"endpoint": DETAILS}
+        await client.send_request(DETAILS, details(role="r2"))
+        with bypass_cache():
+            await client.send_request(DETAILS, details())
+
+    asyncio.run(run())
+    assert len(backend.calls) == 3
+    assert client.stats()["cache"]["hits"] == 1
+    client.close()
+
+
+def test_only_listed_prefixes_are_cached_by_default():
+    backend = Backend()
+    client = client_with(ResponseCache(ttls={DETAILS: 60}), backend)
+
+    async def run():
+        for _ in range(2):
+            await client.send_request("/CompanyBranchLead/Get", {"companyBranchId": "b1", "data": {}})
+
+    asyncio.run(run())
+    assert len(backend.calls) == 2
+    client.close()
+
+
+def test_write_invalidates_reads_of_its_branch_only():
+    backend = Backend()
+    client = client_with(ResponseCache(ttls={DETAILS: 60}), backend)
+
+    async def run():
+        await client.send_request(DETAILS, details("b1"))
+        await client.send_request(DETAILS, details("b2"))
+        await client.send_request("/CompanyBranchRole/Edit", details("b1"))
+        await client.send_request(DETAILS, details("b1"))
+        await client.send_request(DETAILS, details("b2"))
+
+    asyncio.run(run())
+    fetched = [params["companyBranchId"] for endpoint, params, _ in backend.calls if endpoint == DETAILS]
+    assert fetched == ["b1", "b2", "b1"]
+    client.close()
+
+
+def test_api_changes_invalidate_access_reads():
+    backend = Backend()
+    access = "/CompanyBranch/GetAccess"
+    client = client_with(ResponseCache(ttls={access: 60}), backend)
+
+    async def run():
+        for write in ("Edit", "ResetToken", "Remove"):
+            await client.send_request(access, "b1")
+            await client.send_request(access, "b1")
+            await client.send_request(f"/CompanyBranchAPI/{write}", {"companyBranchId": "b1", "apiId": "a1"})
+        await client.send_request(access, "b1")
+
+    asyncio.run(run())
+    assert [endpoint for endpoint, _, _ in backend.calls].count(access) == 4
+    client.close()
+
+
+def test_rejected_write_keeps_the_cache():
+    backend = Backend(lambda endpoint, params, headers:
+                      (400, [], {}) if endpoint.endswith("/Edit") else (200, [], {"ok": True}))
+    client = client_with(ResponseCache(ttls={DETAILS: 60}), backend)
+
+    async def run():
+        await client.send_request(DETAILS, details())
+        await client.send_request("/CompanyBranchRole/Edit", details())
+        await client.send_request(DETAILS, details())
+
+    asyncio.run(run())
+    assert [endpoint for endpoint, _, _ in backend.calls] == [DETAILS, "/CompanyBranchRole/Edit"]
+    client.close()
+
+
+def test_write_drops_cached_404_without_a_read_rule():
+    lead = "/CompanyBranchLead/GetDetails"
+    created = set()
+
+    def handler(endpoint, params, headers):
+        if endpoint.endswith("/Create"):
+            created.add(params["leadId"])
+            return 200, [], {}
+        return (200, [], {"found": True}) if params["leadId"] in created else (404, [], {})
+
+    backend = Backend(handler)
+    cache = ResponseCache(negative_ttl=60, invalidations=InvalidationMap(rules={}, fallback=False))
+    client = client_with(cache, backend)
+    params = {"companyBranchId": "b1", "leadId": "l1"}
+
+    async def run():
+        assert (await client.send_request(lead, params)).status == 404
+        assert (await client.send_request(lead, params)).status == 404
+        await client.send_request("/CompanyBranchLead/Create", params)
+        assert (await client.send_request(lead, params)).status == 200
+
+    asyncio.run(run())
+    assert [endpoint for endpoint, _, _ in backend.calls].count(lead) == 2
+    client.close()
+
+
+def test_expired_entry_is_revalidated_with_its_etag():
+    def handler(endpoint, params, headers):
+        if headers.get("If-None-Match") == '"v1"':
+            return 304, [("ETag", '"v1"')], None
+        return 200, [("ETag", '"v1"')], {"version": 1}
+
+    backend = Backend(handler)
+    client = client_with(ResponseCache(ttls={DETAILS: 0.01}), backend)
+
+    async def run():
+        await client.send_request(DETAILS, details())
+        await asyncio.sleep(0.02)
+        buffered = await client.send_request(DETAILS, details())
+        assert buffered.status == 200 and buffered.json() == {"version": 1}
+        await asyncio.sleep(0.02)
+        streamed = await client.send_request(DETAILS, details(), stream=True)
+        assert streamed.status == 200 and json.loads(await streamed.aread()) == {"version": 1}
+
+    asyncio.run(run())
+    assert [headers.get("If-None-Match") for _, _, headers in backend.calls] == [None, '"v1"', '"v1"']
+    # the 304 answers were drained and closed, so their connections went back to the pool
+    assert all(response._closed for response in backend.responses if response.status == 304)
+    assert client.stats()["cache"]["not_modified"] == 2
+    client.close()
+
+
+def test_disk_tier_survives_a_new_client(tmp_path):
+    path = tmp_path / "cache.sqlite"
+    backend = Backend()
+
+    client = client_with(ResponseCache(ttls={DETAILS: 60}, disk=DiskCache(path)), backend)
+    asyncio.run(client.send_request(DETAILS, details()))
+    client.close()
+
+    client = client_with(ResponseCache(ttls={DETAILS: 60}, disk=DiskCache(path)), backend)
+    response = asyncio.run(client.send_request(DETAILS, details()))
+    assert response.json() == {"endpoint": DETAILS}
+    assert len(backend.calls) == 1
+    client.close()
+
+
+def test_disk_tier_drops_expired_rows_it_reads(tmp_path):
+    path = tmp_path / "cache.sqlite"
+    backend = Backend()
+
+    disk = DiskCache(path, keep_expired=3600)
+    client = client_with(ResponseCache(ttls={DETAILS: 0.01}, disk=disk), backend)
+    asyncio.run(client.send_request(DETAILS, details()))
+    client.close()
+
+    disk = DiskCache(path, keep_expired=3600)
+    assert disk.stats()["entries"] == 1
+    client = client_with(ResponseCache(ttls={DETAILS: 0.01}, disk=disk), backend)
+    time.sleep(0.02)
+
+    # a memory miss that finds only an expired row without validators on disk
+    key = f"{client.api_id} {canonical_key(DETAILS, details())}"
+    assert asyncio.run(client.cache.get(key)) is None
+    disk.flush()
+    assert disk.stats()["entries"] == 0
+    assert len(client.cache) == 0
+    client.close()
+
+
+def test_disk_tier_keeps_expired_rows_with_validators(tmp_path):
+    path = tmp_path / "cache.sqlite"
+    backend = Backend(lambda endpoint, params, headers:
+                      (304, [("ETag", '"v1"')], None) if headers.get("If-None-Match") == '"v1"'
+                      else (200, [("ETag", '"v1"')], {"version": 1}))
+
+    client = client_with(ResponseCache(ttls={DETAILS: 0.01}, disk=DiskCache(path)), backend)
+    asyncio.run(client.send_request(DETAILS, details()))
+    client.close()
+    time.sleep(0.02)
+
+    # the new process compacts on startup, which must not drop the row
+    client = client_with(ResponseCache(ttls={DETAILS: 0.01}, disk=DiskCache(path)), backend)
+    response = asyncio.run(client.send_request(DETAILS, details()))
+    assert response.json() == {"version": 1}
+    assert [headers.get("If-None-Match") for _, _, headers in backend.calls] == [None, '"v1"']
+    client.close()
+
+
+def test_disk_stats_track_the_table_without_querying_it(tmp_path):
+    disk = DiskCache(tmp_path / "cache.sqlite", max_bytes=1500)
+    for i in range(6):
+        disk.put(f"k{i}", CacheEntry(DETAILS, {"companybranchid": f"b{i % 2}"}, 200, "OK", [], b"x" * 500,
+                                     time.time() + 60))
+    disk.put("k0", CacheEntry(DETAILS, {}, 200, "OK", [], b"y" * 100, time.time() + 60))
+    disk.invalidate([DETAILS], lambda fields: fields.get("companybranchid") == "b1")
+    disk._submit(disk.compact)
+    disk.flush()
+
+    entries, size = disk._db.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses").fetchone()
+    # the rows of branch b1 invalidated, the oldest of the rest evicted for size
+    assert (disk.stats()["entries"], disk.stats()["bytes"]) == (entries, size)
+    assert entries == 2 and size <= 1500
+    disk.clear()
+    disk.flush()
+    assert (disk.stats()["entries"], disk.stats()["bytes"]) == (0, 0)
+    disk.close()
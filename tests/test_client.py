@@ -0,0 +1,29 @@
+import asyncio
+
+from src.PlatformClient import PlatformClient
+from src.PlatformClient.utils import BufferedResponse, PlatformResponse
+
+API_ID = "0198742f-14f1-7d6a-8579-3d0ee3f5c5d8"
+
+
+def test_in_flight_limit_works_across_event_loops():
+    client = PlatformClient("https://platform.invalid", API_ID, "token", max_in_flight=2)
+    in_flight = peak = 0
+
+    async def dispatch(path, params, stream, headers=None):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.001)
+        in_flight -= 1
+        return PlatformResponse(BufferedResponse(200, "OK", [], b"{}"))
+
+    client._adaptive_dispatch = dispatch
+
+    async def burst():
+        await asyncio.gather(*(client._limited("/X/Get", "/X/Get", {}, False) for _ in range(8)))
+
+    for _ in range(2):
+        asyncio.run(burst())
+    assert peak == 2
+    client.close()
@@ -0,0 +1,63 @@
+import json
+
+import pytest
+
+from src.PlatformClient.json_stream import ItemScanner
+
+
+def scan(document: bytes, path: str = "data.items", chunk_size: int = 1) -> list:
+    scanner = ItemScanner(path)
+    items = []
+    for start in range(0, len(document), chunk_size):
+        items += [json.loads(item) for item in scanner.feed(document[start:start + chunk_size])]
+    scanner.close()
+    return items
+
+
+DOCUMENT = json.dumps({
+    "meta": {"items": ["not", "this", "one"], "note": "a \"quoted\" ] bracket [ and { brace"},
+    "data": {
+        "count": 4,
+        "items": [
+            {"id": 1, "name": "plain"},
+            {"id": 2, "name": "esc\\aped \"quote\" ]}"},
+            [1, [2, {"deep": [3]}]],
+            "ünïcode ✓",
+        ],
+        "after": {"items": [99]},
+    },
+}, ensure_ascii=False).encode()
+
+EXPECTED = [
+    {"id": 1, "name": "plain"},
+    {"id": 2, "name": "esc\\aped \"quote\" ]}"},
+    [1, [2, {"deep": [3]}]],
+    "ünïcode ✓",
+]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 7, 64, 1 << 16])
+def test_items_under_path_regardless_of_chunking(chunk_size):
+    assert scan(DOCUMENT, chunk_size=chunk_size) == EXPECTED
+
+
+def test_scalars_and_bare_array():
+    assert scan(b' [1, -2.5e3, true, null, "x"] ', path="") == [1, -2500.0, True, None, "x"]
+
+
+def test_empty_array():
+    assert scan(b'{"data": {"items": []}}') == []
+
+
+def test_other_path():
+    assert scan(DOCUMENT, path="meta.items", chunk_size=5) == ["not", "this", "one"]
+
+
+def test_missing_array_raises():
+    with pytest.raises(ValueError):
+        scan(b'{"data": {"rows": [1]}}')
+
+
+def test_truncated_stream_raises():
+    with pytest.raises(ValueError):
+        scan(b'{"data": {"items": [1, 2')
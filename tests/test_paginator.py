@@ -0,0 +1,249 @@
+import asyncio
+import json
+import random
+
+import pytest
+
+from src.PlatformClient.exceptions import PaginationError
+from src.PlatformClient.pagesize import PageSizer
+from src.PlatformClient.paginator import extract_page, paginate
+from src.PlatformClient.query_builder import QueryBuilder
+from src.PlatformClient.utils import BufferedResponse, PlatformResponse
+
+GTE = 8
+
+
+class Listing:
+    """In-memory list endpoint: Offset/Count, OrderQuery, ``>=`` filters and an optional Count cap."""
+
+    def __init__(self, rows, *, cap=None, total=True, sort_key=None, delay=0.0):
+        self.rows = rows
+        self.cap = cap
+        self.total = total
+        self.sort_key = sort_key
+        self.delay = delay
+        self.requests = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    @staticmethod
+    def field(row, path):
+        return row[path[:1].lower() + path[1:]]
+
+    async def __call__(self, query: QueryBuilder) -> PlatformResponse:
+        body = query.build()
+        self.requests.append((body["Offset"], body["Count"]))
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.in_flight -= 1
+
+        data = list(self.rows)
+        for block in body["FilterQuery"]:
+            for condition in block["Properties"]:
+                assert condition["CompareType"] == GTE
+                value = condition["Value"]
+                key = self.sort_key or (lambda path, v: v)
+                data = [row for row in data
+                        if key(condition["PropertyPath"], self.field(row, condition["PropertyPath"]))
+                        >= key(condition["PropertyPath"], value)]
+        for block in body["OrderQuery"]:
+            for order in reversed(block["Properties"]):
+                key = self.sort_key or (lambda path, v: v)
+                data.sort(key=lambda row: key(order["PropertyPath"], self.field(row, order["PropertyPath"])),
+                          reverse=not order["Asc"])
+
+        count = body["Count"] if self.cap is None else min(body["Count"], self.cap)
+        page = data[body["Offset"]:body["Offset"] + count]
+        payload = {"data": {"items": page, "count": len(data)}} if self.total else page
+        return PlatformResponse(BufferedResponse(200, "OK", [], json.dumps(payload).encode()))
+
+
+def rows(n):
+    return [{"id": i, "createdAt": f"2025-01-01T00:00:{i // 7:02d}"} for i in range(n)]
+
+
+def walk(fetch, query=None, **options):
+    async def run():
+        return [item["id"] async for item in paginate(fetch, query, **options)]
+    return asyncio.run(run())
+
+
+def test_extract_page_shapes():
+    assert extract_page([1, 2]) == ([1, 2], None)
+    assert extract_page({"data": {"items": [1], "count": 5}}) == ([1], 5)
+    assert extract_page({"results": [1, 2], "total": 2}) == ([1, 2], 2)
+    with pytest.raises(PaginationError):
+        extract_page({"data": {"nothing": 1}})
+
+
+def test_sequential_walk_from_offset_with_stop_and_limit():
+    listing = Listing(rows(95))
+    assert walk(listing, page_size=10) == list(range(95))
+    assert walk(listing, QueryBuilder().set_offset(90), page_size=10) == list(range(90, 95))
+    assert walk(listing, page_size=10, stop=lambda item: item["id"] == 42) == list(range(42))
+    assert walk(listing, page_size=10, limit=25) == list(range(25))
+
+
+def test_sequential_walk_past_a_server_cap():
+    listing = Listing(rows(237), cap=50)
+    assert walk(listing) == list(range(237))
+
+
+def test_sequential_walk_without_total_ends_on_short_page():
+    listing = Listing(rows(25), total=False)
+    assert walk(listing, page_size=10) == list(range(25))
+    assert len(listing.requests) == 3
+
+
+def test_failed_page_raises():
+    async def fetch(query):
+        return PlatformResponse(BufferedResponse(500, "Internal Server Error", [], b"{}"))
+    with pytest.raises(PaginationError) as error:
+        walk(fetch)
+    assert error.value.status == 500
+
+
+@pytest.mark.parametrize("probe", [False, True])
+def test_parallel_walk_keeps_order_and_concurrency(probe):
+    listing = Listing(rows(1000), delay=0.005)
+    assert walk(listing, page_size=50, concurrency=4, probe=probe) == list(range(1000))
+    assert listing.max_in_flight <= 4
+
+
+@pytest.mark.parametrize("probe", [False, True])
+@pytest.mark.parametrize("limit", [None, 130])
+def test_parallel_walk_fills_windows_past_a_server_cap(probe, limit):
+    listing = Listing(rows(237), cap=50)
+    assert walk(listing, page_size=100, concurrency=4, probe=probe, limit=limit) == list(range(limit or 237))
+
+
+def test_parallel_walk_without_total_falls_back_to_sequential():
+    listing = Listing(rows(95), total=False)
+    assert walk(listing, page_size=10, concurrency=4) == list(range(95))
+
+
+def test_keyset_walk_over_ties():
+    listing = Listing(rows(300))
+    ids = walk(listing, page_size=5, keyset=("CreatedAt", "Id"), compare_type=GTE)
+    assert ids == list(range(300))
+    # the offset never grows beyond one group of equal leading keys
+    assert max(offset for offset, _ in listing.requests) < 7
+
+
+def test_keyset_walk_does_not_order_keys_on_the_client():
+    # .NET trims trailing zeros, "44.66" sorts after "44.664" as a string but not as a time
+    def trimmed(ms):
+        return "44." + (f"{ms:03d}".rstrip("0") or "0")
+
+    def as_time(path, value):
+        return float(value) if path == "CreatedAt" else value
+
+    data = [{"id": i, "createdAt": trimmed((i // 3) * 4)} for i in range(120)]
+    listing = Listing(data, sort_key=as_time)
+    assert walk(listing, page_size=4, keyset=("CreatedAt", "Id"), compare_type=GTE) == list(range(120))
+
+
+def test_keyset_walk_survives_deleted_rows_of_the_current_group():
+    data = rows(70)
+    listing = Listing(data)
+
+    async def run():
+        seen = []
+        async for item in paginate(listing, page_size=5, keyset=("CreatedAt", "Id"), compare_type=GTE):
+            seen.append(item["id"])
+            if item["id"] == 10:
+                # 7..10 share a CreatedAt and were already returned
+                listing.rows = [row for row in data if row["id"] not in (7, 8)]
+        return seen
+
+    assert asyncio.run(run()) == list(range(70))
+
+
+def test_keyset_walk_survives_deletions_while_a_group_is_read_again():
+    # ids 0..19 share a CreatedAt; each deletion shifts the rest of the group
+    data = [{"id": i, "createdAt": f"2025-01-01T00:00:{i // 20:02d}"} for i in range(60)]
+    listing = Listing(data)
+    deletions = {3: 1, 6: 3}
+
+    async def fetch(query):
+        deleted = deletions.get(len(listing.requests) + 1)
+        if deleted is not None:
+            listing.rows = [row for row in listing.rows if row["id"] != deleted]
+        return await listing(query)
+
+    # the second deletion lands while the group is read again after the first
+    assert walk(fetch, page_size=3, keyset=("CreatedAt", "Id"), compare_type=GTE) == list(range(60))
+
+
+@pytest.mark.parametrize("page_size", [3, 10])
+def test_keyset_walk_never_skips_surviving_rows(page_size):
+    rng = random.Random(page_size)
+    for _ in range(100):
+        original = [{"id": i, "createdAt": f"2025-01-01T00:00:{rng.randrange(8):02d}"}
+                    for i in range(rng.randrange(200))]
+        listing = Listing(list(original))
+        deleted = set()
+        next_id = len(original)
+
+        async def fetch(query):
+            nonlocal next_id
+            for _ in range(rng.randrange(3)):
+                if listing.rows and rng.random() < 0.5:
+                    deleted.add(listing.rows.pop(rng.randrange(len(listing.rows)))["id"])
+                else:
+                    listing.rows.append({"id": next_id, "createdAt": f"2025-01-01T00:00:{rng.randrange(8):02d}"})
+                    next_id += 1
+            return await listing(query)
+
+        ids = walk(fetch, page_size=page_size, keyset=("CreatedAt", "Id"), compare_type=GTE)
+        assert len(ids) == len(set(ids))
+        assert {row["id"] for row in original} - deleted <= set(ids)
+
+
+def test_keyset_walk_without_total():
+    listing = Listing(rows(23), total=False)
+    assert walk(listing, page_size=5, keyset=("Id",), compare_type=GTE) == list(range(23))
+
+
+def test_keyset_rejects_own_ordering_and_concurrency():
+    with pytest.raises(PaginationError):
+        walk(Listing(rows(5)), QueryBuilder().order("Name"), keyset=("Id",), compare_type=GTE)
+    with pytest.raises(ValueError):
+        walk(Listing(rows(5)), keyset=("Id",), compare_type=GTE, concurrency=2)
+
+
+def test_page_sizer_tracks_body_size():
+    sizer = PageSizer(initial_size=10, max_size=1000, target_latency=60, target_bytes=4000)
+    listing = Listing(rows(3000))
+    assert walk(listing, sizer=sizer, endpoint="/X/Get") == list(range(3000))
+    size = sizer.size_for("/X/Get")
+    assert 60 <= size <= 150
+    # the next walk starts from the learned size
+    listing.requests.clear()
+    walk(listing, sizer=sizer, endpoint="/X/Get", limit=500)
+    assert listing.requests[0][1] == size
+
+
+@pytest.mark.parametrize("total", [True, False])
+def test_page_sizer_learns_a_server_cap(total):
+    sizer = PageSizer(initial_size=40, min_size=10, target_latency=60, target_bytes=10 ** 9)
+    listing = Listing(rows(237), cap=50, total=total)
+    for _ in range(3):
+        assert walk(listing, sizer=sizer, endpoint="/X/Get") == list(range(237))
+    assert sizer.stats()["/X/Get"]["max_size"] == 50
+    assert sizer.size_for("/X/Get") == 50
+
+
+def test_page_sizer_halves_on_failure_and_respects_bounds():
+    sizer = PageSizer(initial_size=100, min_size=10, max_size=200)
+    sizer.failed("/X/Get")
+    assert sizer.size_for("/X/Get") == 50
+    for _ in range(5):
+        sizer.failed("/X/Get")
+    assert sizer.size_for("/X/Get") == 10
+    for _ in range(10):
+        sizer.observe("/X/Get", sizer.size_for("/X/Get"), sizer.size_for("/X/Get"), 0.001, 10)
+    assert sizer.size_for("/X/Get") == 200